@@ -11,19 +11,19 @@ import sys
 src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
 sys.path.insert(0, src_path)
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from iatoolkit.core import IAToolkit
 from iatoolkit.company_registry import register_company
 from iatoolkit.runtime_logging import configure_runtime_logging
-from companies.sample_company.sample_company import SampleCompany
 
-# load environment variables
-load_dotenv(override=True)
+# load environment variables: parse .env once and apply it in a single update (.env wins, as before)
+os.environ.update({sys.intern(key): value for key, value in dotenv_values().items() if value is not None})
 configure_runtime_logging()
 
 def create_app():
     # IMPORTANT: companies must be registered before creating the IAToolkit
-    register_company('sample_company', SampleCompany)
+    # the class path is imported only when the toolkit instantiates the companies
+    register_company('sample_company', 'companies.sample_company.sample_company:SampleCompany')
 
 
     # create the IAToolkit and Flask instance
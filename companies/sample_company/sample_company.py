@@ -5,35 +5,65 @@
 
 from iatoolkit import BaseCompany
 from iatoolkit import KnowledgeBaseService, SqlService
-from injector import inject
-from companies.sample_company.sample_database import SampleCompanyDatabase
-import click
+from iatoolkit.common.exceptions import IAToolkitException
+from injector import Injector, inject
 import logging
 
 
 class SampleCompany(BaseCompany):
+    __slots__ = ('_injector', '_sql_service', '_knowledge_service', '_sample_database')
+
     @inject
-    def __init__(self,
-                sql_service: SqlService,
-                knowledge_service: KnowledgeBaseService):
+    def __init__(self, injector: Injector):
         super().__init__()
-        self.sql_service = sql_service
-        self.knowledge_service = knowledge_service
+        # services are resolved on first use, so CLI commands only build what they touch
+        self._injector = injector
+        self._sql_service = None
+        self._knowledge_service = None
+        self._sample_database = None
         logging.info('companies: ok')
 
+    @property
+    def sql_service(self) -> SqlService:
+        if self._sql_service is None:
+            self._sql_service = self._injector.get(SqlService)
+        return self._sql_service
+
+    @property
+    def knowledge_service(self) -> KnowledgeBaseService:
+        if self._knowledge_service is None:
+            self._knowledge_service = self._injector.get(KnowledgeBaseService)
+        return self._knowledge_service
+
+    @property
+    def sample_database(self):
+        if self._sample_database is None:
+            # pandas/openpyxl are only needed by the sample database
+            from companies.sample_company.sample_database import SampleCompanyDatabase
+
+            # get the handler to the database
+            sample_db_provider = self.sql_service.get_database_provider('sample_company', 'sample_database')
+            self._sample_database = SampleCompanyDatabase(sample_db_provider)
+        return self._sample_database
+
     def handle_request(self, action: str, **kwargs) -> str:
         return self.unsupported_operation(action)
 
 
     def register_cli_commands(self, app):
+        # click is only needed once the CLI is wired, not on the request path
+        import click
+
         @app.cli.command("create-sample-db")
         def create_sample_db():
-            # get the handler to the database
-            sample_db_provider = self.sql_service.get_database_provider('sample_company', 'sample_database')
-            self.sample_database = SampleCompanyDatabase(sample_db_provider)
-
             """📦 create and populate the database."""
-            if not self.sample_database:
+            try:
+                # the provider is only resolved here, so a missing config surfaces now
+                sample_database = self.sample_database
+            except IAToolkitException:
+                sample_database = None
+
+            if not sample_database:
                 click.echo("❌ Error: La base de datos no está configurada.")
                 click.echo("👉 make sure you have configured the database in the config.py file.")
                 return
@@ -41,8 +71,7 @@ class SampleCompany(BaseCompany):
             try:
                 click.echo(
                     "⚙️  creating and populating the database...")
-                self.sample_database.create_database()
-                self.sample_database.populate_from_excel('companies/sample_company/sample_data/northwind.xlsx')
+                sample_database.create_and_populate('companies/sample_company/sample_data/northwind.xlsx')
                 click.echo("✅ database created and populated successfully!")
             except Exception as e:
                 logging.exception(e)
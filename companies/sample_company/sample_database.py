@@ -1,6 +1,160 @@
+import csv
+import io
+import re
+import sqlite3
 import pandas as pd
 from sqlalchemy import text, inspect
-import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import chain, islice
+from typing import Iterable, Iterator, TextIO
+
+try:
+    import python_calamine  # noqa: F401
+    # the Rust-backed reader parses workbooks several times faster than openpyxl
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    # python-calamine is optional; fall back to pandas' default openpyxl reader
+    _EXCEL_ENGINE = None
+
+# Adjust this path if you place the SQL file elsewhere
+_SCHEMA_SCRIPT_PATH = 'companies/sample_company/sample_data/sample_database_schema.sql'
+
+# Bulk-load tuning for SQLite: skip the fsync and keep temp data in memory while loading.
+# Only connection-level settings: the journal mode would persist in the database file.
+_SQLITE_BULK_LOAD_PRAGMAS = {
+    'synchronous': 'OFF',
+    'temp_store': 'MEMORY',
+    'cache_size': '-200000',
+}
+
+# Bound parameters allowed in one SQLite statement (SQLITE_MAX_VARIABLE_NUMBER, raised from 999 in 3.32).
+_SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+# Rows per executemany batch on server backends (SQLAlchemy folds each batch into multi-row VALUES).
+_BULK_INSERT_BATCH_SIZE = 1000
+
+# Positional placeholder for each DB-API paramstyle that binds by position.
+_POSITIONAL_PLACEHOLDERS = {'qmark': '?', 'format': '%s', 'pyformat': '%s'}
+
+# Read size for the SQL script and approximate size of each script handed to the driver.
+_SQL_READ_BLOCK_SIZE = 1024 * 1024
+_SQL_SCRIPT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# One ';'-terminated statement; semicolons inside single-quoted literals ('' escapes included) don't split.
+_SQL_STATEMENT = re.compile(r"[^;']*(?:'[^']*'[^;']*)*;")
+
+
+def _iter_sql_statements(sql_file: TextIO) -> Iterator[str]:
+    """
+    Yields the non-empty statements of a SQL script, reading the file in blocks
+    so memory stays bounded by the largest statement instead of the whole script.
+    """
+    pending = ''
+    while block := sql_file.read(_SQL_READ_BLOCK_SIZE):
+        pending += block
+        position = 0
+        while match := _SQL_STATEMENT.match(pending, position):
+            statement = pending[position:match.end() - 1].strip()
+            if statement:
+                yield statement
+            position = match.end()
+        pending = pending[position:]
+
+    if pending.strip():
+        yield pending.strip()
+
+
+def _iter_sql_script_chunks(statements: Iterable[str]) -> Iterator[str]:
+    """
+    Groups statements into semicolon-terminated scripts of about _SQL_SCRIPT_CHUNK_SIZE.
+    """
+    chunk, chunk_size = [], 0
+    for statement in statements:
+        chunk.append(statement)
+        chunk_size += len(statement)
+        if chunk_size >= _SQL_SCRIPT_CHUNK_SIZE:
+            yield ";\n".join(chunk) + ";\n"
+            chunk, chunk_size = [], 0
+
+    if chunk:
+        yield ";\n".join(chunk) + ";\n"
+
+
+def _quoted_target(pd_table, connection, keys) -> tuple[str, str]:
+    """
+    Returns the quoted (schema-qualified) table name and column list for a pandas SQL table.
+    """
+    quote = connection.dialect.identifier_preparer.quote
+    table = quote(pd_table.name)
+    if pd_table.schema:
+        table = f"{quote(pd_table.schema)}.{table}"
+    return table, ", ".join(quote(key) for key in keys)
+
+
+class _UnquotedField:
+    """
+    CSV field csv.QUOTE_STRINGS writes unquoted, since it is not a str.
+    """
+    def __init__(self, text: str):
+        self.text = text
+
+    def __str__(self) -> str:
+        return self.text
+
+
+# NULL marker for COPY; strings are all written quoted, so '' and a literal \N still load as text.
+_COPY_NULL = _UnquotedField(r'\N')
+
+
+def _copy_from_csv(pd_table, connection, keys, data_iter) -> int:
+    """
+    pandas to_sql method for PostgreSQL over psycopg2: streams the rows through
+    COPY ... FROM STDIN on the caller's connection (and transaction) instead of
+    parameterized INSERTs.
+    """
+    buffer = io.StringIO()
+    rows = ([_COPY_NULL if value is None else value for value in row] for row in data_iter)
+    csv.writer(buffer, quoting=csv.QUOTE_STRINGS).writerows(rows)
+    buffer.seek(0)
+
+    table, columns = _quoted_target(pd_table, connection, keys)
+    with connection.connection.driver_connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+        return cursor.rowcount
+
+
+def _executemany_positional(pd_table, connection, keys, data_iter) -> int:
+    """
+    pandas to_sql method for the other server backends: hands the row tuples to the
+    driver's executemany as they are, instead of building a dict per row to bind by name.
+    """
+    placeholder = _POSITIONAL_PLACEHOLDERS.get(connection.dialect.paramstyle)
+    if placeholder is None:
+        # named-only drivers, bind the way pandas does by default
+        rows = [dict(zip(keys, row)) for row in data_iter]
+        return connection.execute(pd_table.table.insert(), rows).rowcount
+
+    table, columns = _quoted_target(pd_table, connection, keys)
+    values = ", ".join([placeholder] * len(keys))
+    return connection.exec_driver_sql(f"INSERT INTO {table} ({columns}) VALUES ({values})", list(data_iter)).rowcount
+
+
+@contextmanager
+def _sqlite_bulk_load(connection):
+    """
+    Applies the bulk-load PRAGMAs to the raw SQLite connection for the duration of the block,
+    then puts back the values it had, since the connection returns to the pool.
+    """
+    raw_connection = connection.connection.driver_connection
+    previous = {name: raw_connection.execute(f"PRAGMA {name}").fetchone()[0] for name in _SQLITE_BULK_LOAD_PRAGMAS}
+    for name, value in _SQLITE_BULK_LOAD_PRAGMAS.items():
+        raw_connection.execute(f"PRAGMA {name}={value}")
+    try:
+        yield raw_connection
+    finally:
+        for name, value in previous.items():
+            raw_connection.execute(f"PRAGMA {name}={value}")
 
 
 class SampleCompanyDatabase:
@@ -11,62 +165,164 @@ class SampleCompanyDatabase:
         """
         self.db_manager = db_manager
 
+        # the backend never changes for a given manager, resolve it once
+        self._backend_name = db_manager.get_dialect()
+
     def create_database(self):
         """
         Creates the relational model by executing an external SQL script.
         """
-        # Adjust this path if you place the SQL file elsewhere
-        sql_script_path = 'companies/sample_company/sample_data/sample_database_schema.sql'
+        with self._open_schema_script() as sql_file, self.db_manager.get_connection() as connection:
+            self._create_schema(connection, sql_file)
 
-        if not os.path.exists(sql_script_path):
-            raise FileNotFoundError(f"SQL script not found. Expected at: {sql_script_path}")
+        print(f"Database schema created successfully from '{_SCHEMA_SCRIPT_PATH}'.")
 
-        with open(sql_script_path, 'r', encoding='utf-8') as f:
-            # Split script into individual statements for safer execution
-            sql_script = f.read()
-            statements = [s.strip() for s in sql_script.split(';') if s.strip()]
-
-        with self.db_manager.get_connection() as connection:
-            backend_name = self.db_manager.url.get_backend_name()
-            is_postgres = backend_name in ('postgresql', 'postgres')
+    def create_and_populate(self, xlsx_path: str) -> dict:
+        """
+        Creates the schema and loads the Excel data over a single connection.
+        On server backends both steps share one transaction; SQLite runs the schema
+        script in its own bulk-load transaction first.
+        :param xlsx_path: Path to the .xlsx file (e.g., 'northwind.xlsx')
+        :return: dict with number of rows inserted per table
+        """
+        with self._open_schema_script() as sql_file, self.db_manager.get_connection() as connection:
+            if self._backend_name == 'sqlite':
+                self._create_schema(connection, sql_file)
+                return self._populate_from_excel(connection, xlsx_path)
 
-            # create the schema if it doesn't exist'
             with connection.begin():
-                if self.db_manager.schema and is_postgres:
-                    print(f"⚙️  Creating schema '{self.db_manager.schema}'...")
+                self._create_schema(connection, sql_file)
+                return self._populate_from_excel(connection, xlsx_path)
+
+    @staticmethod
+    def _open_schema_script() -> TextIO:
+        try:
+            return open(_SCHEMA_SCRIPT_PATH, 'r', encoding='utf-8')
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"SQL script not found. Expected at: {_SCHEMA_SCRIPT_PATH}") from e
+
+    @staticmethod
+    def _transaction(connection):
+        # join the caller's transaction when there is one (see create_and_populate)
+        return nullcontext() if connection.in_transaction() else connection.begin()
+
+    def _create_schema(self, connection, sql_file: TextIO):
+        # Split script into individual statements for safer execution, streaming the file
+        statements = _iter_sql_statements(sql_file)
+
+        is_postgres = self._backend_name in ('postgresql', 'postgres')
 
-                    # 1. create the schema and confirm
-                    connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.db_manager.schema}"))
+        if self._backend_name == 'sqlite':
+            self._execute_sqlite_script(connection, statements)
+            return
+
+        # create the schema if it doesn't exist'
+        with self._transaction(connection):
+            if self.db_manager.schema and is_postgres:
+                print(f"⚙️  Creating schema '{self.db_manager.schema}'...")
+
+                # 1. create the schema and confirm
+                connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.db_manager.schema}"))
+
+                # 2. Force the search_path in the same transaction
+                connection.execute(text(f"SET search_path TO {self.db_manager.schema}, public"))
+
+            # 3. execute the table script (inherit the search_path from above)
+            if is_postgres:
+                # psycopg2 runs a multi-statement string in a single round-trip
+                for script_chunk in _iter_sql_script_chunks(statements):
+                    connection.exec_driver_sql(script_chunk)
+                return
+
+            for statement in statements:
+                connection.execute(text(statement))
+
+    @staticmethod
+    def _execute_sqlite_script(connection, statements: Iterable[str]):
+        """
+        Runs the script as a few large executescript calls inside one explicit
+        transaction, so SQLite fsyncs once instead of once per statement.
+        """
+        statements = iter(statements)
+        head = list(islice(statements, 2))
 
-                    # 2. Force the search_path in the same transaction
-                    connection.execute(text(f"SET search_path TO {self.db_manager.schema}, public"))
+        with _sqlite_bulk_load(connection) as raw_connection:
+            # take over transaction control, otherwise executescript commits before every chunk
+            previous_autocommit = raw_connection.autocommit
+            raw_connection.autocommit = True
+            try:
+                if len(head) < 2:
+                    # a single statement is atomic on its own, the BEGIN/COMMIT pair would only add a round-trip
+                    for statement in head:
+                        raw_connection.execute(statement)
+                    return
 
-                # 3. execute the table script (inherit the search_path from above)
-                for statement in statements:
-                    connection.execute(text(statement))
+                raw_connection.execute("BEGIN")
+                for script_chunk in _iter_sql_script_chunks(chain(head, statements)):
+                    raw_connection.executescript(script_chunk)
+                raw_connection.execute("COMMIT")
+            except Exception:
+                if raw_connection.in_transaction:
+                    raw_connection.execute("ROLLBACK")
+                raise
+            finally:
+                raw_connection.autocommit = previous_autocommit
 
-        print(f"Database schema created successfully from '{sql_script_path}'.")
+    @staticmethod
+    def _insert_options(dialect_name: str, driver: str, column_count: int) -> dict:
+        """
+        SQLite is local, so multi-row INSERTs as large as its parameter limit allows
+        are cheapest. PostgreSQL over psycopg2 loads each sheet with a single COPY
+        (copy_expert is psycopg2 API); other server backends and drivers go through
+        executemany in fixed-size batches of positional rows to bound statement size
+        and memory.
+        """
+        if dialect_name == 'sqlite':
+            return {'method': 'multi', 'chunksize': max(1, _SQLITE_MAX_VARIABLES // column_count)}
+        if dialect_name in ('postgresql', 'postgres') and driver == 'psycopg2':
+            return {'method': _copy_from_csv}
+        return {'method': _executemany_positional, 'chunksize': _BULK_INSERT_BATCH_SIZE}
 
     @staticmethod
     def _normalize_df(df: pd.DataFrame, date_cols: list[str]) -> pd.DataFrame:
         """
         Normalizes a DataFrame by handling NaNs and converting date columns.
+        The frame is modified in place, callers pass a frame they own.
         """
-        df = df.copy()
         # Ensure missing date columns exist
-        for col in date_cols:
-            if col not in df.columns:
-                df[col] = None
+        missing = [col for col in date_cols if col not in df.columns]
+        if missing:
+            df[missing] = None
 
         # Convert date-like columns to Python date objects
         for c in date_cols:
-            if c in df.columns:
-                df[c] = pd.to_datetime(df[c], errors="coerce").dt.date
+            df[c] = pd.to_datetime(df[c], errors="coerce").dt.date
 
-        # Replace NaN with None for SQLAlchemy
-        df = df.where(pd.notnull(df), None)
+        # Replace NaN with None for SQLAlchemy, touching only the columns that have any
+        nulls = df.isna()
+        for c in df.columns[nulls.any().to_numpy()]:
+            df[c] = df[c].astype(object).where(~nulls[c], None)
         return df
 
+    def _read_sheet(self, workbook: pd.ExcelFile, plan: tuple, db_columns: list[str]) -> pd.DataFrame:
+        """
+        Parses one sheet of the load plan and shapes it for its table.
+        """
+        sheet_name, _, date_cols, deduplicate_on = plan
+        df = workbook.parse(sheet_name, dtype=object)
+
+        # Standardize DataFrame columns to lowercase to match the database schema.
+        df.columns = [c.lower() for c in df.columns]
+
+        # dedupe on the sheet's own columns, the key doesn't have to be a table column
+        if deduplicate_on:
+            df.drop_duplicates(subset=deduplicate_on, keep='first', inplace=True)
+
+        # keep only the table's columns before normalizing, so the sheet is copied once
+        df = df.reindex(columns=[col for col in db_columns if col in df.columns or col in date_cols])
+
+        return self._normalize_df(df, date_cols)
+
     def populate_from_excel(self, xlsx_path: str) -> dict:
         """
         Populate the Northwind schema by reading data from an Excel file.
@@ -74,6 +330,10 @@ class SampleCompanyDatabase:
         :param xlsx_path: Path to the .xlsx file (e.g., 'northwind.xlsx')
         :return: dict with number of rows inserted per table
         """
+        with self.db_manager.get_connection() as connection:
+            return self._populate_from_excel(connection, xlsx_path)
+
+    def _populate_from_excel(self, connection, xlsx_path: str) -> dict:
         # Simplified mapping: (Excel sheet, SQL table, date columns, columns for deduplication)
         schema_plan = [
             ("Categories", "categories", [], None),
@@ -89,51 +349,61 @@ class SampleCompanyDatabase:
             ("EmployeeTerritories", "employee_territories", [], ["employeeid", "territoryid"]),
         ]
 
-        xls = pd.read_excel(xlsx_path, sheet_name=None, dtype=object)
-        results = {}
+        results = {plan[1]: 0 for plan in schema_plan}
         table_name = ""
 
-        try:
-            with self.db_manager.get_connection() as connection:
-                with connection.begin():  # Manages the transaction (commit/rollback)
-                    inspector = inspect(connection.engine)
-
-                    if connection.dialect.name == 'sqlite':
-                        connection.execute(text("PRAGMA foreign_keys = ON;"))
+        # PRAGMAs can't be switched inside a transaction, so only tune a connection we own
+        bulk_load = nullcontext()
+        if self._backend_name == 'sqlite' and not connection.in_transaction():
+            bulk_load = _sqlite_bulk_load(connection)
 
-                    for sheet_name, table_name, date_cols, deduplicate_on in schema_plan:
-                        if sheet_name not in xls:
-                            results[table_name] = 0
-                            continue
+        # sheets are parsed one at a time in the loop, so only one is held in memory at once
+        with pd.ExcelFile(xlsx_path, engine=_EXCEL_ENGINE) as workbook:
+            try:
+                with bulk_load, self._transaction(connection):  # Manages the transaction (commit/rollback)
+                    # bound to the connection so it sees tables created earlier in the same transaction
+                    inspector = inspect(connection)
 
-                        df = xls[sheet_name]
+                    if self._backend_name == 'sqlite':
+                        connection.execute(text("PRAGMA foreign_keys = ON;"))
+                        # check the foreign keys once at COMMIT instead of after every insert
+                        connection.execute(text("PRAGMA defer_foreign_keys = ON;"))
 
-                        # Standardize DataFrame columns to lowercase to match the database schema.
-                        df.columns = [c.lower() for c in df.columns]
+                    # one metadata fetch for every target table instead of a round-trip per sheet
+                    table_columns = {
+                        name: [col['name'] for col in columns]
+                        for (_, name), columns in inspector.get_multi_columns(
+                            schema=self.db_manager.schema,
+                            filter_names=[plan[1] for plan in schema_plan],
+                        ).items()
+                    }
 
-                        df = self._normalize_df(df, date_cols)
+                    loads = [plan for plan in schema_plan if plan[0] in workbook.sheet_names]
 
-                        if deduplicate_on:
-                            df.drop_duplicates(subset=deduplicate_on, keep='first', inplace=True)
+                    # parse the next sheet on a worker thread while the current one is being inserted
+                    with ThreadPoolExecutor(max_workers=1) as reader:
+                        def read_sheet(plan):
+                            return self._read_sheet(workbook, plan, table_columns[plan[1]])
 
-                        # This intersection will now work perfectly.
-                        db_columns = [col['name'] for col in inspector.get_columns(table_name, schema=self.db_manager.schema)]
-                        df_filtered = df[[col for col in db_columns if col in df.columns]].copy()
+                        next_sheet = reader.submit(read_sheet, loads[0]) if loads else None
+                        for position, (_, table_name, _, _) in enumerate(loads):
+                            df_filtered = next_sheet.result()
+                            if position + 1 < len(loads):
+                                next_sheet = reader.submit(read_sheet, loads[position + 1])
 
-                        if not df_filtered.empty:
-                            df_filtered.to_sql(
-                                table_name,
-                                con=connection,
-                                schema=self.db_manager.schema,
-                                if_exists='append',
-                                index=False,
-                                method='multi'
-                            )
-                            results[table_name] = len(df_filtered)
-                        else:
-                            results[table_name] = 0
+                            if not df_filtered.empty:
+                                df_filtered.to_sql(
+                                    table_name,
+                                    con=connection,
+                                    schema=self.db_manager.schema,
+                                    if_exists='append',
+                                    index=False,
+                                    **self._insert_options(
+                                        self._backend_name, connection.dialect.driver, len(df_filtered.columns))
+                                )
+                                results[table_name] = len(df_filtered)
 
-        except Exception as e:
-            raise RuntimeError(f"Error populating data from '{xlsx_path}' for table '{table_name}': {e}") from e
+            except Exception as e:
+                raise RuntimeError(f"Error populating data from '{xlsx_path}' for table '{table_name}': {e}") from e
 
-        return results
\ No newline at end of file
+        return results
@@ -7,6 +7,9 @@
 from abc import ABC, abstractmethod
 
 class BaseCompany(ABC):
+    # attributes assigned by IAToolkit when the company is loaded;
+    # subclasses that declare their own __slots__ avoid a per-instance __dict__
+    __slots__ = ('company_short_name', 'company')
 
     @abstractmethod
     # execute the specific action configured in the intent table
@@ -0,0 +1,32 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional (the 'speedups' extra); the standard library is used without it
+    orjson = None
+
+# orjson turns integers beyond 64 bits into floats instead of failing
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+
+
+def json_loads(data: str) -> Any:
+    """
+    Parses a JSON document, with orjson when it is installed.
+    Documents orjson would read differently (NaN, Infinity, lone surrogates,
+    integers beyond 64 bits) are parsed by json, so the result never depends
+    on the extra.
+    """
+    if orjson is not None and not _LONG_DIGIT_RUN.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
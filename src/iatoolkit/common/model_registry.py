@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from injector import inject, singleton
+import re
 from typing import Literal
 
 
@@ -37,6 +38,9 @@ class ModelRegistry:
     - Provide convenience helpers (is_openai, is_gemini, is_deepseek, etc.).
     """
 
+    # distinct model names remembered by get_provider before the memo is reset
+    _PROVIDER_CACHE_SIZE = 1024
+
     @inject
     def __init__(self):
         # Hardcoded rules for now; can be extended or loaded from config later.
@@ -49,9 +53,27 @@ class ModelRegistry:
             "anthropic": ("claude", "claude-3", "claude-2"),
             "openrouter": ("openrouter/",),
         }
+        # One anchored alternative per provider, tried in the order above, so a single
+        # match() still returns the first provider with any matching pattern.
+        self._provider_pattern = re.compile(
+            "|".join(
+                f"(?=.*?(?:{'|'.join(map(re.escape, self._minimal_patterns(patterns)))}))(?P<{provider}>)"
+                for provider, patterns in self._provider_patterns.items()
+            ),
+            re.DOTALL,
+        )
+        self._provider_cache: dict[str, ProviderType] = {}
         self._reasoning_effort_options = ("minimal", "low", "medium", "high", "xhigh")
         self._text_verbosity_options = ("low", "medium", "high")
 
+    @staticmethod
+    def _minimal_patterns(patterns: tuple[str, ...]) -> list[str]:
+        # a pattern that contains a shorter one of the same provider can never decide a match
+        return [
+            pat for pat in dict.fromkeys(patterns)
+            if not any(other != pat and other in pat for other in patterns)
+        ]
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -68,12 +90,14 @@ class ModelRegistry:
         if not model:
             return "unknown"
 
-        model_lower = model.lower()
-        for provider, patterns in self._provider_patterns.items():
-            if any(pat in model_lower for pat in patterns):
-                return provider
-
-        return "unknown"
+        provider = self._provider_cache.get(model)
+        if provider is None:
+            match = self._provider_pattern.match(model.lower())
+            provider = match.lastgroup if match else "unknown"
+            if len(self._provider_cache) >= self._PROVIDER_CACHE_SIZE:
+                self._provider_cache.clear()
+            self._provider_cache[model] = provider
+        return provider
 
     def normalize_provider(self, provider: str | None = None, model: str | None = None) -> ProviderType:
         candidate = str(provider or "").strip().lower()
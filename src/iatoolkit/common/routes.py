@@ -3,10 +3,9 @@
 #
 # IAToolkit is open source software.
 
-from io import BytesIO
 import mimetypes
-from flask import render_template, redirect, url_for, current_app, abort, send_file
-from flask import jsonify
+from flask import render_template, redirect, url_for, current_app, abort, send_file, request
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
 from iatoolkit.common.exceptions import IAToolkitException
 
 
@@ -297,20 +296,33 @@ def register_views(app):
                 return redirect(signed_url)
 
             # Fallback path: stream bytes from storage through Flask.
-            file_bytes = storage_service.get_document_content(company_short_name, storage_key)
+            file_stream, file_size = storage_service.open_document(company_short_name, storage_key)
             guessed_mime, _ = mimetypes.guess_type(output_filename)
-            return send_file(
-                BytesIO(file_bytes),
+            response = send_file(
+                file_stream,
                 as_attachment=True,
                 download_name=output_filename,
                 mimetype=guessed_mime or "application/octet-stream",
+                conditional=False,
             )
 
+            # send_file only knows the size of paths and BytesIO: set it from storage
+            # so the response keeps its Content-Length and can serve byte ranges
+            if file_size is not None:
+                response.content_length = file_size
+            try:
+                return response.make_conditional(request, accept_ranges=True, complete_length=file_size)
+            except RequestedRangeNotSatisfiable:
+                file_stream.close()
+                raise
+
         except IAToolkitException as e:
             if e.error_type == IAToolkitException.ErrorType.CALL_ERROR:
                 abort(404)
             abort(500, str(e))
 
 
+    # the version is fixed for the life of the process: serialize it once at registration
+    version_body = f"{app.json.dumps({'iatoolkit_version': app.config.get('VERSION', 'N/A')})}\n"
     app.add_url_rule('/version', 'version',
-                     lambda: jsonify({"iatoolkit_version": current_app.config.get('VERSION', 'N/A')}))
+                     lambda: current_app.response_class(version_body, mimetype=app.json.mimetype))
@@ -3,8 +3,9 @@
 #
 # IAToolkit is open source software.
 
-from typing import Dict, Type, Any, Optional
+from typing import Dict, Type, Any, Optional, Union
 from .base_company import BaseCompany
+import importlib
 import logging
 from injector import inject
 
@@ -17,7 +18,7 @@ class CompanyRegistry:
 
     @inject
     def __init__(self):
-        self._company_classes: Dict[str, Type[BaseCompany]] = {}
+        self._company_classes: Dict[str, Union[Type[BaseCompany], str]] = {}
         self._company_instances: Dict[str, BaseCompany] = {}
         self._revision: int = 0
 
@@ -27,22 +28,51 @@ class CompanyRegistry:
     def get_revision(self) -> int:
         return self._revision
 
-    def _store_company_class(self, name: str, company_class: Type[BaseCompany]) -> str:
+    def _store_company_class(self, name: str, company_class: Union[Type[BaseCompany], str]) -> str:
         company_key = name.lower()
         self._company_classes[company_key] = company_class
         self._bump_revision()
         return company_key
 
-    def register(self, name: str, company_class: Type[BaseCompany]) -> None:
+    @staticmethod
+    def _validate_company_class(company_class) -> None:
+        if not isinstance(company_class, type) or not issubclass(company_class, BaseCompany):
+            name = getattr(company_class, '__name__', repr(company_class))
+            raise ValueError(f"The class {name} must be a subclass of BaseCompany")
+
+    @classmethod
+    def _resolve_company_class(cls, company_class: Union[Type[BaseCompany], str]) -> Type[BaseCompany]:
+        """
+        Import a company class given as 'package.module:ClassName'.
+        Classes registered directly are returned unchanged.
+        """
+        if not isinstance(company_class, str):
+            return company_class
+
+        module_name, _, class_name = company_class.partition(':')
+        if not module_name or not class_name:
+            raise ValueError(f"Invalid company class path '{company_class}', expected 'module:ClassName'")
+
+        resolved = getattr(importlib.import_module(module_name), class_name)
+        cls._validate_company_class(resolved)
+        return resolved
+
+    def register(self, name: str, company_class: Union[Type[BaseCompany], str]) -> None:
         """
         Registers a company in the registry.
 
+        The company class can also be given as a 'module:ClassName' string,
+        in which case it is imported when the companies are instantiated.
+
         COMMUNITY EDITION LIMITATION:
         This base implementation enforces a strict single-tenant limit.
         It raises a RuntimeError if a second company is registered.
         """
-        if not issubclass(company_class, BaseCompany):
-            raise ValueError(f"The class {company_class.__name__} must be a subclass of BaseCompany")
+        if isinstance(company_class, str):
+            if ':' not in company_class:
+                raise ValueError(f"Invalid company class path '{company_class}', expected 'module:ClassName'")
+        else:
+            self._validate_company_class(company_class)
 
         company_key = name.lower()
 
@@ -62,9 +92,14 @@ class CompanyRegistry:
         """
         intantiate all registered companies using the toolkit injector
         """
-        for company_key, company_class in self._company_classes.items():
+        for company_key, company_class in list(self._company_classes.items()):
             if company_key not in self._company_instances:
                 try:
+                    # import lazily registered classes once, then keep the class
+                    if isinstance(company_class, str):
+                        company_class = self._resolve_company_class(company_class)
+                        self._company_classes[company_key] = company_class
+
                     # use de injector to create the instance
                     company_instance = injector.get(company_class)
 
@@ -84,7 +119,7 @@ class CompanyRegistry:
     def get_company_instance(self, company_name: str) -> Optional[BaseCompany]:
         return self._company_instances.get(company_name.lower())
 
-    def get_registered_companies(self) -> Dict[str, Type[BaseCompany]]:
+    def get_registered_companies(self) -> Dict[str, Union[Type[BaseCompany], str]]:
         return self._company_classes.copy()
 
     def clear(self) -> None:
@@ -104,7 +139,7 @@ def get_company_registry() -> CompanyRegistry:
     """Get the global company registry instance."""
     return _company_registry
 
-def get_registered_companies() -> Dict[str, Type[BaseCompany]]:
+def get_registered_companies() -> Dict[str, Union[Type[BaseCompany], str]]:
     return _company_registry.get_registered_companies()
 
 def get_company_instance(company_short_name: str) -> Optional[BaseCompany]:
@@ -124,12 +159,12 @@ def set_company_registry(registry: CompanyRegistry) -> None:
     logging.info(f"✅ Company Registry implementation swapped: {type(registry).__name__}")
 
 
-def register_company(name: str, company_class: Type[BaseCompany]) -> None:
+def register_company(name: str, company_class: Union[Type[BaseCompany], str]) -> None:
     """
     Public function to register a company.
 
     Args:
         name: Name of the company
-        company_class: Class that inherits from BaseCompany
+        company_class: Class that inherits from BaseCompany, or its 'module:ClassName' path
     """
     _company_registry.register(name, company_class)
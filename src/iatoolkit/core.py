@@ -124,6 +124,10 @@ class IAToolkit:
         self._sync_system_tools_on_boot()
         self._run_configured_startup_warmup()
 
+        # build the URL matcher now, every route is registered by this point,
+        # so the first request doesn't pay for it while holding werkzeug's remap lock
+        self.app.url_map.update()
+
         # register data sources
         if start:
             self.register_data_sources()
@@ -171,8 +175,11 @@ class IAToolkit:
             logging.exception("⚠️ Startup warm-up failed.")
 
     def _get_config_value(self, key: str, default=None):
-        # get a value from the config dict or the environment variable
-        return self.config.get(key, os.getenv(key, default))
+        # get a value from the config dict or the environment variable.
+        # the environment is only consulted when the config dict has no entry.
+        if key in self.config:
+            return self.config[key]
+        return os.getenv(key, default)
 
     def _get_redis_max_connections(self) -> int:
         raw_value = self._get_config_value("REDIS_MAX_CONNECTIONS", "30")
@@ -532,6 +539,11 @@ class IAToolkit:
                 raise e
 
     def _setup_cli_commands(self):
+        # commands are only reachable through the `flask` entrypoint, which sets
+        # FLASK_RUN_FROM_CLI before loading the app; web and worker processes skip them
+        if not os.getenv('FLASK_RUN_FROM_CLI'):
+            return
+
         from iatoolkit.cli_commands import register_core_commands
         from iatoolkit.company_registry import get_company_registry
 
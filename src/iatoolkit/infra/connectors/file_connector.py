@@ -4,7 +4,8 @@
 # IAToolkit is open source software.
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
+import io
 
 
 class FileConnector(ABC):
@@ -26,3 +27,9 @@ class FileConnector(ABC):
 
     def generate_presigned_url(self, file_path: str, expiration: int = 3600) -> Optional[str]:
         return None
+
+    def open_file(self, file_path: str) -> tuple[BinaryIO, Optional[int]]:
+        # readable stream over the file and its size in bytes (None if unknown);
+        # connectors that can stream from the backend override this
+        content = self.get_file_content(file_path)
+        return io.BytesIO(content), len(content)
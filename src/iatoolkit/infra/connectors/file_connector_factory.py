@@ -4,9 +4,6 @@ from typing import Dict
 from iatoolkit.common.interfaces.secret_provider import SecretProvider
 from iatoolkit.infra.connectors.file_connector import FileConnector
 from iatoolkit.infra.connectors.local_file_connector import LocalFileConnector
-from iatoolkit.infra.connectors.s3_connector import S3Connector
-from iatoolkit.infra.connectors.google_cloud_storage_connector import GoogleCloudStorageConnector
-from iatoolkit.infra.connectors.google_drive_connector import GoogleDriveConnector
 
 
 class FileConnectorFactory:
@@ -123,6 +120,8 @@ class FileConnectorFactory:
                         )
                     }
 
+            # boto3 and the google SDKs are slow to import, only load the one this connector needs
+            from iatoolkit.infra.connectors.s3_connector import S3Connector
             return S3Connector(
                 bucket=config['bucket'],
                 prefix=config.get('prefix', ''),
@@ -136,6 +135,7 @@ class FileConnectorFactory:
                 company_short_name,
                 config.get('service_account_secret_ref'),
             )
+            from iatoolkit.infra.connectors.google_drive_connector import GoogleDriveConnector
             return GoogleDriveConnector(
                 folder_id=config['folder_id'],
                 service_account_path=config.get('service_account', 'service_account.json'),
@@ -148,6 +148,7 @@ class FileConnectorFactory:
                 company_short_name,
                 config.get('service_account_secret_ref'),
             )
+            from iatoolkit.infra.connectors.google_cloud_storage_connector import GoogleCloudStorageConnector
             return GoogleCloudStorageConnector(
                 bucket_name=config['bucket'],
                 service_account_path=config.get('service_account_path', 'service_account.json'),
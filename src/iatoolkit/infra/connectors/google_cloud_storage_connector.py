@@ -5,7 +5,7 @@
 
 from iatoolkit.infra.connectors.file_connector import FileConnector
 from google.cloud import storage
-from typing import List
+from typing import BinaryIO, List, Optional
 
 
 class GoogleCloudStorageConnector(FileConnector):
@@ -66,6 +66,13 @@ class GoogleCloudStorageConnector(FileConnector):
 
         return file_buffer
 
+    def open_file(self, file_path: str) -> tuple[BinaryIO, Optional[int]]:
+        # load the metadata first so a missing blob fails here, not on the first read;
+        # BlobReader then fetches the blob in chunks as it is read
+        blob = self.bucket.blob(file_path)
+        blob.reload()
+        return blob.open('rb'), blob.size
+
     def delete_file(self, file_path: str) -> None:
         """
         Elimina un archivo del bucket dado su path.
@@ -5,7 +5,7 @@
 
 import os
 from iatoolkit.infra.connectors.file_connector import FileConnector
-from typing import List
+from typing import BinaryIO, List, Optional
 from iatoolkit.common.exceptions import IAToolkitException
 
 
@@ -45,6 +45,14 @@ class LocalFileConnector(FileConnector):
             raise IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR,
                                f"Error leyendo el archivo {file_path}: {e}")
 
+    def open_file(self, file_path: str) -> tuple[BinaryIO, Optional[int]]:
+        try:
+            file = open(file_path, 'rb')
+            return file, os.fstat(file.fileno()).st_size
+        except Exception as e:
+            raise IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR,
+                               f"Error leyendo el archivo {file_path}: {e}")
+
     def upload_file(self, file_path: str, content: bytes, content_type: str = None) -> None:
         # Nota: file_path debe ser relativo al directorio raíz configurado
         full_path = os.path.join(self.directory, file_path)
@@ -5,7 +5,7 @@
 
 import boto3
 from iatoolkit.infra.connectors.file_connector import FileConnector
-from typing import List
+from typing import BinaryIO, List, Optional
 
 
 class S3Connector(FileConnector):
@@ -15,9 +15,12 @@ class S3Connector(FileConnector):
         self.folder = folder
         self.s3 = boto3.client('s3', **auth)
 
-    def list_files(self, prefix: str | None = None) -> List[dict]:
+    def list_files(self, prefix: str | None = None, extension: str | None = None) -> List[dict]:
         # List only real S3 objects representing files, excluding folder placeholders.
+        # ListObjectsV2 can only filter by prefix, so the (case-insensitive) extension
+        # is applied to each page before any entry is built.
         list_prefix = self._resolve_list_prefix(prefix)
+        normalized_extension = str(extension or "").strip().lower()
         files = []
         continuation_token = None
 
@@ -33,6 +36,7 @@ class S3Connector(FileConnector):
             files.extend(
                 obj for obj in response.get('Contents', [])
                 if self._is_file_key(obj.get('Key'))
+                and (not normalized_extension or obj['Key'].lower().endswith(normalized_extension))
             )
 
             if not response.get("IsTruncated"):
@@ -83,6 +87,11 @@ class S3Connector(FileConnector):
         response = self.s3.get_object(Bucket=self.bucket, Key=file_path)
         return response['Body'].read()
 
+    def open_file(self, file_path: str) -> tuple[BinaryIO, Optional[int]]:
+        # the StreamingBody reads from the HTTP response as it is consumed
+        response = self.s3.get_object(Bucket=self.bucket, Key=file_path)
+        return response['Body'], response.get('ContentLength')
+
     def delete_file(self, file_path: str) -> None:
         self.s3.delete_object(Bucket=self.bucket, Key=file_path)
 
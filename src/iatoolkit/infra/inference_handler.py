@@ -4,22 +4,15 @@ import io
 import logging
 import gc
 import json
+import os
+import struct
+from collections import OrderedDict
 
-import requests
 import torch
-import numpy as np
-from PIL import Image
-import scipy.io.wavfile
 import tempfile
-from diffusers import DiffusionPipeline, DPMSolverMultistepScheduler
-from diffusers.utils import export_to_video
 
-# Transformers imports
-from transformers import (
-    CLIPProcessor, CLIPModel,
-    AutoTokenizer, AutoModel,
-    pipeline
-)
+# transformers, diffusers and PIL take seconds to import and each model
+# family needs only one of them: they are imported in the branch that uses them.
 
 class EndpointHandler:
     TEXT_EMBEDDING_MODEL_HINTS = (
@@ -34,21 +27,33 @@ class EndpointHandler:
         "snowflake-arctic-embed",
         "stella",
     )
+    IMAGE_DOWNLOAD_TIMEOUT_SECONDS = 15
+    # models kept loaded at once; IATOOLKIT_MAX_RESIDENT_MODELS raises it so alternating
+    # between models does not reload from disk, as long as the GPU has room for all of them
+    DEFAULT_MAX_RESIDENT_MODELS = 1
+
+    _http_session = None
 
     def __init__(self, path: str = ""):
         self.current_model_id = None
         self.model_instance = None
         self.processor_instance = None
         self.pipeline_instance = None
+        # model_id -> (model, processor, pipeline), least recently used first
+        self._resident_models = OrderedDict()
+        self.max_resident_models = self._read_max_resident_models()
 
         # 1. Detección Inteligente de Hardware
         if torch.cuda.is_available():
             self.device = "cuda"
             self.dtype = torch.float16 # GPU = Rápido
+            # embedding models: bf16 keeps fp32 range at half the bytes where the GPU has it
+            self.embedding_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
             logging.info("Handler initialized on CUDA (GPU) with float16")
         else:
             self.device = "cpu"
             self.dtype = torch.float32 # CPU = Compatible
+            self.embedding_dtype = torch.float32
             logging.info("Handler initialized on CPU with float32")
 
     @classmethod
@@ -60,17 +65,56 @@ class EndpointHandler:
             return False
         return any(hint in model_lower for hint in cls.TEXT_EMBEDDING_MODEL_HINTS)
 
-    def _clean_memory(self):
-        if self.model_instance is not None:
-            del self.model_instance
-        if self.processor_instance is not None:
-            del self.processor_instance
-        if self.pipeline_instance is not None:
-            del self.pipeline_instance
+    @classmethod
+    def _read_max_resident_models(cls) -> int:
+        raw_value = os.getenv("IATOOLKIT_MAX_RESIDENT_MODELS", "").strip()
+        if not raw_value:
+            return cls.DEFAULT_MAX_RESIDENT_MODELS
+        try:
+            return max(1, int(raw_value))
+        except ValueError:
+            logging.warning(f"Invalid IATOOLKIT_MAX_RESIDENT_MODELS '{raw_value}', "
+                            f"keeping {cls.DEFAULT_MAX_RESIDENT_MODELS}")
+            return cls.DEFAULT_MAX_RESIDENT_MODELS
 
+    @classmethod
+    def _get_http_session(cls):
+        # one keep-alive session for all image downloads
+        if cls._http_session is None:
+            import requests
+            cls._http_session = requests.Session()
+        return cls._http_session
+
+    def _image_draft_edge(self) -> int | None:
+        # twice the processor input edge: a reduced JPEG decode that still leaves room for its resize
+        size = getattr(getattr(self.processor_instance, "image_processor", None), "size", None)
+        if not isinstance(size, dict):
+            return None
+        edges = [value for value in size.values() if isinstance(value, int) and value > 0]
+        return 2 * max(edges) if edges else None
+
+    def _compile(self, forward):
+        # inductor needs triton, so only compile on GPU; IATOOLKIT_DISABLE_COMPILE=1 keeps eager mode
+        disabled = os.getenv("IATOOLKIT_DISABLE_COMPILE", "").strip().lower() in {"1", "true", "yes", "on"}
+        if self.device != "cuda" or disabled or not hasattr(torch, "compile"):
+            return forward
+        # dynamic shapes: text lengths vary per request and must not trigger a recompile each time
+        return torch.compile(forward, dynamic=True)
+
+    def _autocast(self):
+        # processors emit float32 tensors: autocast feeds them to the half-precision weights on GPU
+        return torch.autocast(device_type=self.device, dtype=self.embedding_dtype, enabled=self.device == "cuda")
+
+    def _clean_memory(self, keep: int = 0):
+        # unload least recently used models until at most `keep` stay resident
         self.model_instance = None
         self.processor_instance = None
         self.pipeline_instance = None
+        if len(self._resident_models) <= keep:
+            return
+
+        while len(self._resident_models) > keep:
+            self._resident_models.popitem(last=False)
 
         gc.collect()
         if torch.cuda.is_available():
@@ -80,22 +124,42 @@ class EndpointHandler:
         if self.current_model_id == model_id:
             return
 
+        resident = self._resident_models.get(model_id)
+        if resident is not None:
+            self._resident_models.move_to_end(model_id)
+            self.model_instance, self.processor_instance, self.pipeline_instance = resident
+            self.current_model_id = model_id
+            return
+
         logging.info(f"Loading new model: {model_id}...")
-        self._clean_memory()
+        # make room before loading so peak memory never holds more than max_resident_models
+        self.current_model_id = None
+        self._clean_memory(keep=self.max_resident_models - 1)
 
         try:
             # CLIP, text embeddings, Whisper...
             if "clip" in model_id.lower():
+                from transformers import CLIPProcessor, CLIPModel
                 self.processor_instance = CLIPProcessor.from_pretrained(model_id)
-                self.model_instance = CLIPModel.from_pretrained(model_id).to(self.device)
+                self.model_instance = CLIPModel.from_pretrained(
+                    model_id, torch_dtype=self.embedding_dtype
+                ).to(self.device)
                 self.model_instance.eval()
+                # the handlers call these directly, so compiling forward() alone would not reach them
+                self.model_instance.get_text_features = self._compile(self.model_instance.get_text_features)
+                self.model_instance.get_image_features = self._compile(self.model_instance.get_image_features)
 
             elif self._is_text_embedding_model(model_id):
+                from transformers import AutoTokenizer, AutoModel
                 self.processor_instance = AutoTokenizer.from_pretrained(model_id)
-                self.model_instance = AutoModel.from_pretrained(model_id).to(self.device)
+                self.model_instance = AutoModel.from_pretrained(
+                    model_id, torch_dtype=self.embedding_dtype
+                ).to(self.device)
                 self.model_instance.eval()
+                self.model_instance = self._compile(self.model_instance)
 
             elif "whisper" in model_id.lower():
+                from transformers import pipeline
                 self.pipeline_instance = pipeline(
                     "automatic-speech-recognition",
                     model=model_id,
@@ -105,6 +169,7 @@ class EndpointHandler:
             # --- GENERACIÓN DE IMAGEN (SD / TinySD) ---
             elif any(x in model_id.lower() for x in ["stable-diffusion", "tiny-sd", "sd"]):
                 logging.info(f"Initializing Diffusion Pipeline for {model_id}")
+                from diffusers import DiffusionPipeline
 
                 # INTENTO 1: Carga estándar (busca safetensors por defecto en versiones nuevas)
                 try:
@@ -131,6 +196,7 @@ class EndpointHandler:
             # --- TEXT TO SPEECH ---
             elif any(x in model_id.lower() for x in ["mms", "speech", "tts", "vibevoice"]):
                 logging.info(f"Initializing TTS pipeline for {model_id}")
+                from transformers import pipeline
                 self.pipeline_instance = pipeline(
                     "text-to-speech",
                     model=model_id,
@@ -140,6 +206,7 @@ class EndpointHandler:
             # --- VIDEO ---
             elif "text-to-video" in model_id.lower():
                 logging.info(f"Initializing Video Pipeline for {model_id}")
+                from diffusers import DiffusionPipeline, DPMSolverMultistepScheduler
                 self.pipeline_instance = DiffusionPipeline.from_pretrained(
                     model_id,
                     torch_dtype=self.dtype,
@@ -156,6 +223,9 @@ class EndpointHandler:
             else:
                 raise ValueError(f"No handler logic defined for model: {model_id}")
 
+            self._resident_models[model_id] = (
+                self.model_instance, self.processor_instance, self.pipeline_instance
+            )
             self.current_model_id = model_id
             logging.info(f"Model {model_id} loaded successfully.")
 
@@ -168,26 +238,35 @@ class EndpointHandler:
         if mode == "text":
             text = inputs.get("text")
             inputs_pt = self.processor_instance(text=[text], return_tensors="pt", padding=True, truncation=True).to(self.device)
-            with torch.no_grad():
+            with torch.inference_mode(), self._autocast():
                 emb = self.model_instance.get_text_features(**inputs_pt)
         else:
+            from PIL import Image
+
             url = inputs.get("url") or inputs.get("presigned_url")
             base64_image = inputs.get("base64")
 
             if url:
-                image = Image.open(requests.get(url, stream=True).raw)
+                response = self._get_http_session().get(url, timeout=self.IMAGE_DOWNLOAD_TIMEOUT_SECONDS)
+                response.raise_for_status()
+                image = Image.open(io.BytesIO(response.content))
             elif base64_image:
                 image = Image.open(io.BytesIO(base64.b64decode(base64_image)))
             else:
                 raise ValueError("Image URL or base64 needed")
 
+            draft_edge = self._image_draft_edge()
+            if draft_edge:
+                # only JPEG honours this; other formats decode at full size as before
+                image.draft("RGB", (draft_edge, draft_edge))
+
             if image.mode != "RGB":
                 image = image.convert("RGB")
 
             inputs_pt = self.processor_instance(images=image, return_tensors="pt").to(self.device)
-            with torch.no_grad():
+            with torch.inference_mode(), self._autocast():
                 emb = self.model_instance.get_image_features(**inputs_pt)
-        emb = torch.nn.functional.normalize(emb, p=2, dim=-1)
+        emb = torch.nn.functional.normalize(emb.float(), p=2, dim=-1)
         vec = emb[0].cpu().tolist()
         return {"embedding": vec}
 
@@ -202,34 +281,66 @@ class EndpointHandler:
             truncation=True,
             return_tensors='pt'
         ).to(self.device)
-        with torch.no_grad():
-            model_output = self.model_instance(**encoded_input)
-
-        token_embeddings = model_output[0]
-        attention_mask = encoded_input['attention_mask']
-        input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
-        sentence_embeddings = torch.sum(token_embeddings * input_mask_expanded, 1) / torch.clamp(
-            input_mask_expanded.sum(1),
-            min=1e-9
-        )
-        sentence_embeddings = torch.nn.functional.normalize(sentence_embeddings, p=2, dim=1)
+        with torch.inference_mode():
+            with self._autocast():
+                model_output = self.model_instance(**encoded_input)
+
+            # masked mean pooling as a single contraction: no (batch, seq, hidden) mask copy
+            token_embeddings = model_output[0].float()
+            mask = encoded_input['attention_mask'].to(token_embeddings.dtype)
+            summed = torch.einsum('bsh,bs->bh', token_embeddings, mask)
+            counts = mask.sum(dim=1, keepdim=True).clamp_(min=1e-9)
+            sentence_embeddings = torch.nn.functional.normalize(summed / counts, p=2, dim=1)
         return {"embedding": sentence_embeddings[0].cpu().tolist()}
 
     # Backward-compatible alias: existing tests/callers may still refer to _handle_minilm
     def _handle_minilm(self, inputs: dict) -> dict:
         return self._handle_text_embedding(inputs)
 
+    @staticmethod
+    def _build_wav_bytes(data, rate: int) -> bytearray:
+        # same layout scipy.io.wavfile.write produces, with the samples appended once as raw memory
+        import numpy as np
+
+        kind = data.dtype.kind
+        if not (kind in "if" or (kind == "u" and data.dtype.itemsize == 1)):
+            raise ValueError(f"Unsupported WAV sample type: {data.dtype}")
+        samples = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("<"))
+
+        is_pcm = kind in "iu"
+        channels = 1 if samples.ndim == 1 else samples.shape[1]
+        sample_width = samples.dtype.itemsize
+        fmt_chunk = struct.pack(
+            "<HHIIHH",
+            1 if is_pcm else 3,  # PCM / IEEE float
+            channels,
+            rate,
+            rate * channels * sample_width,
+            channels * sample_width,
+            sample_width * 8,
+        )
+        if not is_pcm:
+            fmt_chunk += b"\x00\x00"  # cbSize, required for non-PCM formats
+        header = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt_chunk)) + fmt_chunk
+        if not is_pcm:
+            header += b"fact" + struct.pack("<II", 4, samples.shape[0])
+        header += b"data" + struct.pack("<I", samples.nbytes)
+
+        wav = bytearray(b"RIFF" + struct.pack("<I", len(header) + samples.nbytes) + header)
+        wav += samples.data
+        return wav
+
     def _handle_tts(self, inputs: dict) -> dict:
         text = inputs.get("text")
         output = self.pipeline_instance(text)
-        audio_data = output["audio"]
         sampling_rate = output["sampling_rate"]
-        wav_buffer = io.BytesIO()
-        scipy.io.wavfile.write(wav_buffer, rate=sampling_rate, data=audio_data.T)
-        b64_out = base64.b64encode(wav_buffer.getvalue()).decode("utf-8")
+        wav_bytes = self._build_wav_bytes(output["audio"].T, sampling_rate)
+        b64_out = base64.b64encode(wav_bytes).decode("utf-8")
         return {"audio_base64": b64_out, "sampling_rate": sampling_rate, "content_type": "audio/wav"}
 
     def _handle_text_to_video(self, inputs: dict) -> dict:
+        from diffusers.utils import export_to_video
+
         prompt = inputs.get("text")
         video_frames = self.pipeline_instance(prompt, num_inference_steps=25).frames
         with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp_file:
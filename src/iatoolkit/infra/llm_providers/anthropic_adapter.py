@@ -6,20 +6,25 @@
 import json
 import logging
 import mimetypes
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional
 
 from iatoolkit.common.exceptions import IAToolkitException
+from iatoolkit.common.json_utils import json_loads
 from iatoolkit.infra.llm_response import LLMResponse, ToolCall, Usage
 
-
 class AnthropicAdapter:
     """Adapter for Anthropic Messages API."""
 
+    # pending tool calls remembered before the oldest is dropped (outputs that never arrive)
+    _MAX_PENDING_TOOL_CALLS = 1024
+
     def __init__(self, anthropic_client):
         self.client = anthropic_client
-        # call_id -> {"name": str, "input": dict}
+        # call_id -> {"name": str, "input": dict}, oldest first
         # Used to reconstruct required tool_use blocks when receiving function_call_output.
-        self._tool_calls_by_id: Dict[str, Dict[str, Any]] = {}
+        self._tool_calls_by_id: OrderedDict[str, Dict[str, Any]] = OrderedDict()
 
     def create_response(self,
                         model: str,
@@ -49,7 +54,8 @@ class AnthropicAdapter:
         _ = metadata
 
         try:
-            full_input = (context_history or []) + input
+            # _prepare_messages walks the history once, no need to copy it into a new list
+            full_input = chain(context_history or (), input)
             system_prompt, messages = self._prepare_messages(full_input, images or [])
 
             params: Dict[str, Any] = {
@@ -96,12 +102,13 @@ class AnthropicAdapter:
         if callable(record_input):
             record_input(payload)
 
-    def _prepare_messages(self, input_items: List[Dict], images: List[Dict]) -> tuple[Optional[str], List[Dict]]:
+    def _prepare_messages(self, input_items: Iterable[Dict], images: List[Dict]) -> tuple[Optional[str], List[Dict]]:
         system_parts: List[str] = []
         messages: List[Dict] = []
 
         for item in input_items:
-            if item.get("role") == "system":
+            role = item.get("role")
+            if role == "system":
                 content = item.get("content")
                 if content:
                     system_parts.append(str(content))
@@ -156,7 +163,6 @@ class AnthropicAdapter:
                     )
                 continue
 
-            role = item.get("role")
             if role in ("assistant", "model"):
                 role = "assistant"
             elif role != "user":
@@ -324,6 +330,9 @@ class AnthropicAdapter:
                         "name": name,
                         "input": normalized_args,
                     }
+                    self._tool_calls_by_id.move_to_end(call_id)
+                    while len(self._tool_calls_by_id) > self._MAX_PENDING_TOOL_CALLS:
+                        self._tool_calls_by_id.popitem(last=False)
                 tool_calls.append(
                     ToolCall(
                         call_id=call_id,
@@ -386,7 +395,7 @@ class AnthropicAdapter:
             return "{}"
         if isinstance(args, str):
             try:
-                parsed = json.loads(args)
+                parsed = json_loads(args)
                 return json.dumps(parsed, ensure_ascii=False)
             except Exception:
                 return json.dumps({"value": args}, ensure_ascii=False)
@@ -405,7 +414,7 @@ class AnthropicAdapter:
             return args
         if isinstance(args, str):
             try:
-                parsed = json.loads(args)
+                parsed = json_loads(args)
                 if isinstance(parsed, dict):
                     return parsed
                 return {"value": parsed}
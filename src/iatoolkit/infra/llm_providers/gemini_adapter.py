@@ -59,14 +59,15 @@ class GeminiAdapter:
             _ = store
             _ = metadata
 
+            # both passes below read the same history: build the combined list once
+            full_input = (context_history or []) + input
+
             # Separamos las instrucciones del sistema del resto del contenido
-            system_instruction, filtered_input = self._extract_system_and_filter_input(
-                (context_history or []) + input
-            )
+            system_instruction, filtered_input = self._extract_system_and_filter_input(full_input)
 
             # prepare tools and contents
             contents = self._prepare_gemini_contents(
-                (context_history or []) + input,
+                full_input,
                 images=images,
                 attachments=attachments,
             )
@@ -6,7 +6,6 @@
 
 from iatoolkit.services.configuration_service import ConfigurationService
 from iatoolkit.infra.llm_providers.openai_adapter import OpenAIAdapter
-from iatoolkit.infra.llm_providers.gemini_adapter import GeminiAdapter
 from iatoolkit.infra.llm_providers.deepseek_adapter import DeepseekAdapter
 from iatoolkit.infra.llm_providers.openai_compatible_chat_adapter import OpenAICompatibleChatAdapter
 from iatoolkit.infra.llm_providers.openrouter_adapter import OpenRouterAdapter
@@ -253,6 +252,8 @@ class LLMProxy:
         if provider == self.PROVIDER_OPENAI:
             return OpenAIAdapter(client)
         if provider == self.PROVIDER_GEMINI:
+            # the google-genai SDK takes about a second to import, only pay for it when Gemini is used
+            from iatoolkit.infra.llm_providers.gemini_adapter import GeminiAdapter
             return GeminiAdapter(client)
         if provider == self.PROVIDER_DEEPSEEK:
             return DeepseekAdapter(client)
@@ -8,11 +8,14 @@ from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.dialects import registry
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.engine.url import make_url
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.engine.reflection import ObjectKind
 from iatoolkit.repositories.models import Base, ORM_SCHEMA
 from injector import inject
 from pgvector.psycopg2 import register_vector
 from iatoolkit.common.interfaces.database_provider import DatabaseProvider
 from iatoolkit.common.exceptions import is_worker_timeout_signal
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 
@@ -21,6 +24,8 @@ class DatabaseManager(DatabaseProvider):
     )
     _DEFAULT_CONNECT_TIMEOUT = 60
     MAX_RESULT_ROWS = 1000
+    # concurrent per-table reflections, kept below the engine pool_size
+    _REFLECTION_WORKERS = 8
 
     @inject
     def __init__(self,
@@ -59,6 +64,7 @@ class DatabaseManager(DatabaseProvider):
                 pool_use_lifo=True,
                 connect_args=self._build_connect_args(),
                 future=True,
+                **self._build_engine_options(),
             )
         translated_schema = self.schema if self._is_postgres() else None
         self._engine = raw_engine.execution_options(
@@ -168,6 +174,12 @@ class DatabaseManager(DatabaseProvider):
             "connect_timeout": resolved_timeout,
         }
 
+    def _build_engine_options(self) -> dict:
+        # pyodbc binds executemany row by row unless asked to send the whole parameter array at once
+        if self.backend == 'mssql' and self.url.get_driver_name() == 'pyodbc':
+            return {"fast_executemany": True}
+        return {}
+
     def _effective_schema(self) -> str | None:
         if self.backend == 'sqlite':
             return None
@@ -325,6 +337,72 @@ class DatabaseManager(DatabaseProvider):
             normalized.append(name)
         return normalized
 
+    @staticmethod
+    def _dialect_reflects_in_bulk(dialect) -> bool:
+        """
+        True when the dialect ships its own batched get_multi_columns next to get_columns.
+        SQLAlchemy's default implementation just loops over the tables one query at a time.
+        """
+        for cls in type(dialect).__mro__:
+            if 'get_columns' in vars(cls):
+                return cls is not DefaultDialect and 'get_multi_columns' in vars(cls)
+        return False
+
+    @staticmethod
+    def _reflect_table(inspector, table: str, schema: str | None) -> tuple[list, list]:
+        columns = inspector.get_columns(table, schema=schema)
+        # Obtener PKs para marcarlas
+        pks = inspector.get_pk_constraint(table, schema=schema).get('constrained_columns', [])
+        return columns, pks
+
+    def _reflect_tables_concurrently(self, schema: str | None, names: list[str]) -> dict:
+        """
+        Reflects each table on its own pooled connection and returns {name: (columns, pks) or the error}.
+        """
+        if not names:
+            return {}
+
+        def reflect(table: str):
+            # inspectors keep a per-instance cache and are not shared across threads
+            return self._reflect_table(inspect(self._engine), table, schema)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self._REFLECTION_WORKERS, len(names))) as executor:
+            futures = {name: executor.submit(reflect, name) for name in names}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = e
+        return results
+
+    @staticmethod
+    def _get_multi_column_metadata(inspector, schema: str | None,
+                                   names: list[str]) -> tuple[dict, dict] | None:
+        """
+        Returns ({name: columns}, {name: pk column names}) for the given tables and views,
+        or None when the dialect can't reflect them in bulk.
+        """
+        if not names:
+            return {}, {}
+
+        kind = ObjectKind.TABLE | ObjectKind.VIEW
+        try:
+            columns = inspector.get_multi_columns(schema=schema, filter_names=names, kind=kind)
+            pk_constraints = inspector.get_multi_pk_constraint(schema=schema, filter_names=names, kind=kind)
+        except Exception as e:
+            if is_worker_timeout_signal(e):
+                raise
+            logging.debug("Bulk reflection unavailable for schema %s, inspecting per table: %s", schema, e)
+            return None
+
+        columns_by_name = {name: table_columns for (_, name), table_columns in columns.items()}
+        pks_by_name = {
+            name: (pk_constraint or {}).get('constrained_columns') or []
+            for (_, name), pk_constraint in pk_constraints.items()
+        }
+        return columns_by_name, pks_by_name
+
     def get_database_structure(self) -> dict:
         inspector = inspect(self._engine)
         structure = {}
@@ -339,14 +417,31 @@ class DatabaseManager(DatabaseProvider):
             for view_name in self._safe_inspector_name_list(inspector.get_view_names, effective_schema)
         )
 
+        table_names = [table for table, _ in schema_objects]
+        bulk_metadata = None
+        concurrent_metadata = {}
+        if self.backend != 'sqlite' and not self._dialect_reflects_in_bulk(self._engine.dialect):
+            # one round-trip per table: overlap them instead of waiting on each in turn
+            concurrent_metadata = self._reflect_tables_concurrently(effective_schema, table_names)
+        else:
+            # reflect every object's columns and PKs in one pass instead of two queries per table
+            bulk_metadata = self._get_multi_column_metadata(inspector, effective_schema, table_names)
+
         for table, object_type in schema_objects:
             columns_data = []
 
             # get columns
             try:
-                columns = inspector.get_columns(table, schema=effective_schema)
-                # Obtener PKs para marcarlas
-                pks = inspector.get_pk_constraint(table, schema=effective_schema).get('constrained_columns', [])
+                if table in concurrent_metadata:
+                    reflected = concurrent_metadata[table]
+                    if isinstance(reflected, Exception):
+                        raise reflected
+                    columns, pks = reflected
+                elif bulk_metadata is not None:
+                    columns = bulk_metadata[0].get(table, [])
+                    pks = bulk_metadata[1].get(table, [])
+                else:
+                    columns, pks = self._reflect_table(inspector, table, effective_schema)
 
                 for col in columns:
                     columns_data.append({
@@ -114,6 +114,34 @@ class LLMQueryRepo:
         else:
             tool = self.session.query(Tool).filter_by(company_id=new_tool.company_id, name=new_tool.name).first()
 
+        tool = self._merge_tool(tool, new_tool)
+        self.session.commit()
+        return tool
+
+    def create_or_update_company_tools(self, company_id: int, new_tools: List[Tool], commit: bool = True) -> List[Tool]:
+        """
+        Upserts several company tools with one lookup query.
+        With commit=False the changes stay in the caller's transaction.
+        """
+        names = [tool.name for tool in new_tools]
+        existing = {}
+        if names:
+            existing = {
+                tool.name: tool
+                for tool in self.session.query(Tool).filter(Tool.company_id == company_id, Tool.name.in_(names))
+            }
+
+        tools = []
+        for new_tool in new_tools:
+            tool = self._merge_tool(existing.get(new_tool.name), new_tool)
+            existing[tool.name] = tool
+            tools.append(tool)
+
+        if commit:
+            self.session.commit()
+        return tools
+
+    def _merge_tool(self, tool: Tool | None, new_tool: Tool) -> Tool:
         if tool:
             tool.name = new_tool.name
             tool.description = new_tool.description
@@ -124,16 +152,15 @@ class LLMQueryRepo:
             tool.source = new_tool.source
             if new_tool.is_active is not None:
                 tool.is_active = new_tool.is_active
-        else:
-            self.session.add(new_tool)
-            tool = new_tool
+            return tool
 
-        self.session.commit()
-        return tool
+        self.session.add(new_tool)
+        return new_tool
 
-    def delete_tool(self, tool: Tool):
+    def delete_tool(self, tool: Tool, commit: bool = True):
         self.session.delete(tool)
-        self.session.commit()
+        if commit:
+            self.session.commit()
 
     # -- Prompt related methods
 
@@ -178,6 +205,35 @@ class LLMQueryRepo:
     def create_or_update_prompt(self, new_prompt: Prompt):
         prompt = self.session.query(Prompt).filter_by(company_id=new_prompt.company_id,
                                                  name=new_prompt.name).first()
+        prompt = self._merge_prompt(prompt, new_prompt)
+        self.session.commit()
+        return prompt
+
+    def create_or_update_prompts(self, company_id: int, new_prompts: List[Prompt], commit: bool = True) -> List[Prompt]:
+        """
+        Upserts several prompts of a company with one lookup query.
+        With commit=False the changes stay in the caller's transaction.
+        """
+        names = [prompt.name for prompt in new_prompts]
+        existing = {}
+        if names:
+            existing = {
+                prompt.name: prompt
+                for prompt in self.session.query(Prompt).filter(Prompt.company_id == company_id,
+                                                                Prompt.name.in_(names))
+            }
+
+        prompts = []
+        for new_prompt in new_prompts:
+            prompt = self._merge_prompt(existing.get(new_prompt.name), new_prompt)
+            existing[prompt.name] = prompt
+            prompts.append(prompt)
+
+        if commit:
+            self.session.commit()
+        return prompts
+
+    def _merge_prompt(self, prompt: Prompt | None, new_prompt: Prompt) -> Prompt:
         if prompt:
             prompt.category_id = new_prompt.category_id
             prompt.description = new_prompt.description
@@ -226,7 +282,6 @@ class LLMQueryRepo:
             self.session.add(new_prompt)
             prompt = new_prompt
 
-        self.session.commit()
         return prompt
 
     def delete_prompt(self, prompt: Prompt):
@@ -244,11 +299,43 @@ class LLMQueryRepo:
     def create_or_update_prompt_category(self, new_category: PromptCategory):
         category = self.session.query(PromptCategory).filter_by(company_id=new_category.company_id,
                                                       name=new_category.name).first()
+        category = self._merge_prompt_category(category, new_category)
+        self.session.commit()
+        return category
+
+    def create_or_update_prompt_categories(self,
+                                           company_id: int,
+                                           new_categories: List[PromptCategory],
+                                           commit: bool = True) -> List[PromptCategory]:
+        """
+        Upserts several prompt categories with one lookup query.
+        New categories are flushed so their ids are available even with commit=False.
+        """
+        names = [category.name for category in new_categories]
+        existing = {}
+        if names:
+            existing = {
+                category.name: category
+                for category in self.session.query(PromptCategory).filter(PromptCategory.company_id == company_id,
+                                                                          PromptCategory.name.in_(names))
+            }
+
+        categories = []
+        for new_category in new_categories:
+            category = self._merge_prompt_category(existing.get(new_category.name), new_category)
+            existing[category.name] = category
+            categories.append(category)
+
+        if commit:
+            self.session.commit()
+        else:
+            self.session.flush()
+        return categories
+
+    def _merge_prompt_category(self, category: PromptCategory | None, new_category: PromptCategory) -> PromptCategory:
         if category:
             category.order = new_category.order
-        else:
-            self.session.add(new_category)
-            category = new_category
+            return category
 
-        self.session.commit()
-        return category
+        self.session.add(new_category)
+        return new_category
@@ -7,12 +7,22 @@ from iatoolkit.repositories.models import (User, Company, user_company,
                                            UserFeedback, AccessLog)
 from injector import inject
 from iatoolkit.repositories.database_manager import DatabaseManager
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, event
 from sqlalchemy.exc import OperationalError
 import logging
 
 
 class ProfileRepo:
+    # short_name -> company id, shared by the process; entries are dropped
+    # when a company row is deleted or renamed (see the mapper events below)
+    _company_ids: dict[str, int] = {}
+
+    @classmethod
+    def _forget_company_id(cls, company_id: int, keep_short_name: str | None = None):
+        for short_name, cached_id in list(cls._company_ids.items()):
+            if cached_id == company_id and short_name != keep_short_name:
+                cls._company_ids.pop(short_name, None)
+
     @inject
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
@@ -75,7 +85,18 @@ class ProfileRepo:
         # Retry once for transient SSL/network disconnects from pooled connections.
         for attempt in (1, 2):
             try:
-                return self.session.query(Company).filter(Company.short_name == short_name).first()
+                company_id = self._company_ids.get(short_name)
+                if company_id is not None:
+                    # primary key lookup: served from the session identity map once loaded
+                    company = self.session.get(Company, company_id)
+                    if company is not None and company.short_name == short_name:
+                        return company
+                    self._company_ids.pop(short_name, None)
+
+                company = self.session.query(Company).filter(Company.short_name == short_name).first()
+                if company is not None and company.id is not None:
+                    self._company_ids[short_name] = company.id
+                return company
             except OperationalError as e:
                 try:
                     self.session.rollback()
@@ -178,9 +199,20 @@ class ProfileRepo:
             company = new_company
 
         self.session.commit()
+        self._company_ids[company.short_name] = company.id
         return company
 
     def save_feedback(self, feedback: UserFeedback):
         self.session.add(feedback)
         self.session.commit()
         return feedback
+
+
+@event.listens_for(Company, 'after_delete')
+def _forget_deleted_company(mapper, connection, target):
+    ProfileRepo._forget_company_id(target.id)
+
+
+@event.listens_for(Company, 'after_update')
+def _forget_renamed_company(mapper, connection, target):
+    ProfileRepo._forget_company_id(target.id, keep_short_name=target.short_name)
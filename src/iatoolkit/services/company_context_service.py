@@ -8,9 +8,30 @@ from iatoolkit.common.interfaces.asset_storage import AssetRepository, AssetType
 from iatoolkit.services.sql_source_service import SqlSourceService
 from iatoolkit.services.sql_service import SqlService
 import logging
+import threading
+import time
 import yaml
 from injector import inject
-from typing import List, Dict
+from typing import List
+
+# a failing database fails the same way on every request: warn once per interval per key
+_CONTEXT_WARNING_INTERVAL_SECONDS = 300
+_last_context_warnings: dict[tuple, float] = {}
+_context_warnings_lock = threading.Lock()
+
+
+def _warn_throttled(key: tuple, message: str):
+    now = time.monotonic()
+    with _context_warnings_lock:
+        last_warning = _last_context_warnings.get(key)
+        throttled = last_warning is not None and now - last_warning < _CONTEXT_WARNING_INTERVAL_SECONDS
+        if not throttled:
+            _last_context_warnings[key] = now
+
+    if throttled:
+        logging.debug(message)
+    else:
+        logging.warning(message)
 
 
 class CompanyContextService:
@@ -82,7 +103,10 @@ class CompanyContextService:
                 sql_context = sql_context.strip()
                 sql_source_table_scopes = self._get_sql_source_table_scopes(company_short_name)
             except Exception as e:
-                logging.warning(f"Could not generate SQL context for '{company_short_name}': {e}")
+                _warn_throttled(
+                    ("sql_context", company_short_name, type(e).__name__),
+                    f"Could not generate SQL context for '{company_short_name}': {e}",
+                )
 
         # 3. Context from residual yaml (schema/*.yaml) files
         if include_yaml_context:
@@ -143,7 +167,10 @@ class CompanyContextService:
             )
             return sql_context
         except Exception as e:
-            logging.warning(f"Could not generate SQL context for '{company_short_name}': {e}")
+            _warn_throttled(
+                ("sql_context", company_short_name, type(e).__name__),
+                f"Could not generate SQL context for '{company_short_name}': {e}",
+            )
             return ""
 
     def _get_sql_source_table_scopes(self, company_short_name: str) -> dict[str, set[str] | None]:
@@ -222,14 +249,15 @@ class CompanyContextService:
                 # 2. Build Header for this Database
                 dialect = self.sql_service.get_database_dialect(company_short_name, db_name)
                 dialect_suffix = f" [dialect={dialect}]" if dialect else ""
-                db_context = f"### Base SQL (`database_key`): {db_name}{dialect_suffix}\n"
+                # pieces are collected and joined once, instead of growing one string per column
+                db_parts = [f"### Base SQL (`database_key`): {db_name}{dialect_suffix}\n"]
 
                 # Optional: Add DB description from config if available (useful context)
                 db_desc = source.get('description', '')
                 if db_desc:
-                    db_context += f"- Descripcion: {db_desc}\n"
+                    db_parts.append(f"- Descripcion: {db_desc}\n")
 
-                db_context += (
+                db_parts.append(
                     f"- Usa `iat_sql_query` con `database_key='{db_name}'` para consultar esta base.\n"
                 )
 
@@ -239,11 +267,11 @@ class CompanyContextService:
                     columns = table_data.get('columns', [])
 
                     # Table Header
-                    table_str = f"\n\n#### Tabla: `{table_name}`"
+                    db_parts.append(f"\n\n#### Tabla: `{table_name}`")
                     if table_desc:
-                        table_str += f"\n- Descripcion: {table_desc}"
+                        db_parts.append(f"\n- Descripcion: {table_desc}")
 
-                    table_str += "\n- Columnas:"
+                    db_parts.append("\n- Columnas:")
 
                     # Format Columns
                     for col in columns:
@@ -252,30 +280,25 @@ class CompanyContextService:
                         col_desc = col.get('description', '')
                         col_props = col.get('properties') # Nested JSONB structure
 
-                        col_line = f"\n  - `{col_name}` ({col_type})"
+                        db_parts.append(f"\n  - `{col_name}` ({col_type})")
                         if col_desc:
-                            col_line += f": {col_desc}"
-
-                        table_str += col_line
+                            db_parts.append(f": {col_desc}")
 
                         # If it has nested properties (JSONB enriched from YAML), format them
                         if col_props:
-                            table_str += "\n"
-                            table_str += self._format_json_schema(col_props, 2) # Indent level 2
-
-                    db_context += table_str
+                            db_parts.append("\n")
+                            db_parts.append(self._format_json_schema(col_props, 2)) # Indent level 2
 
-                    # collect the table names for later use
-                    db_tables.append(
-                        {'db_name': db_name,
-                         'table_name': table_name,
-                         }
-                    )
+                    # collect the (db_name, table_name) pairs for later use
+                    db_tables.append((db_name, table_name))
 
-                context_output.append(db_context)
+                context_output.append("".join(db_parts))
 
             except Exception as e:
-                logging.warning(f"Could not generate enriched SQL context for '{db_name}': {e}")
+                _warn_throttled(
+                    ("enriched_sql_context", company_short_name, db_name, type(e).__name__),
+                    f"Could not generate enriched SQL context for '{db_name}': {e}",
+                )
 
         if not context_output:
             return "", []
@@ -291,13 +314,20 @@ class CompanyContextService:
     def _get_yaml_schema_context(
         self,
         company_short_name: str,
-        db_tables: List[Dict],
+        db_tables: List[tuple[str, str]],
         sql_source_table_scopes: dict[str, set[str] | None] | None = None,
     ) -> str:
         # Get context from .yaml schema files using the repository
-        yaml_schema_context = ''
+        yaml_schema_parts = []
         sql_source_table_scopes = sql_source_table_scopes or {}
 
+        # every (db_name, name candidate) already covered by the SQL context
+        covered_tables = {
+            (db_name, candidate)
+            for db_name, table_name in db_tables
+            for candidate in self._table_name_candidates(table_name)
+        }
+
         try:
             # 1. List yaml files in the schema "folder"
             schema_files = self.asset_repo.list_files(company_short_name, AssetType.SCHEMA, extension='.yaml')
@@ -309,9 +339,8 @@ class CompanyContextService:
                     table_name = f.split('.')[0]
 
                     exists = any(
-                        item["db_name"] == dbname
-                        and bool(self._table_name_candidates(item["table_name"]) & self._table_name_candidates(table_name))
-                        for item in db_tables
+                        (dbname, candidate) in covered_tables
+                        for candidate in self._table_name_candidates(table_name)
                     )
                     if exists:
                         continue
@@ -330,7 +359,7 @@ class CompanyContextService:
                     # 4. Generate markdown description from the dict
                     if schema_dict:
                         # We use generate_schema_table which accepts a dict directly
-                        yaml_schema_context += self.generate_schema_table(schema_dict) + "\n\n"
+                        yaml_schema_parts.append(self.generate_schema_table(schema_dict) + "\n\n")
 
                 except Exception as e:
                     logging.warning(f"Error processing schema file {filename}: {e}")
@@ -338,7 +367,7 @@ class CompanyContextService:
         except Exception as e:
             logging.warning(f"Error listing schema files for {company_short_name}: {e}")
 
-        return yaml_schema_context
+        return "".join(yaml_schema_parts)
 
     def generate_schema_table(self, schema: dict) -> str:
         if not schema or not isinstance(schema, dict):
@@ -418,7 +447,7 @@ class CompanyContextService:
 
     def _get_static_file_context(self, company_short_name: str, *, selected_filenames: List[str] | None = None) -> str:
         # Get context from .md files using the repository
-        static_context = ''
+        static_parts = []
 
         try:
             for filename in self._resolve_context_filenames(
@@ -428,7 +457,7 @@ class CompanyContextService:
                 try:
                     # 2. Read content
                     content = self.asset_repo.read_text(company_short_name, AssetType.CONTEXT, filename)
-                    static_context += content + "\n"  # Append content
+                    static_parts.append(content + "\n")  # Append content
                 except Exception as e:
                     logging.warning(f"Error reading context file {filename}: {e}")
 
@@ -436,7 +465,7 @@ class CompanyContextService:
             # If listing fails (e.g. folder doesn't exist), just log and return empty
             logging.warning(f"Error listing context files for {company_short_name}: {e}")
 
-        return static_context
+        return "".join(static_parts)
 
     def _list_context_markdown_filenames(self, company_short_name: str) -> list[str]:
         try:
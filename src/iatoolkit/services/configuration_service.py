@@ -15,6 +15,18 @@ import logging
 import os
 from urllib.parse import urlparse
 
+# allowed values for the enumerated settings checked by _validate_configuration;
+# built once at import instead of on every company load
+_AGENT_ROLES = frozenset({"workspace_chat", "workspace_agent", "channels", "operations"})
+_QUEUE_TIERS = frozenset({"default", "low"})
+_OUTPUT_SCHEMA_MODES = frozenset({"best_effort", "strict"})
+_OUTPUT_RESPONSE_MODES = frozenset({"chat_compatible", "structured_only"})
+_ATTACHMENT_MODES = frozenset({"extracted_only", "native_only", "native_plus_extracted"})
+_ATTACHMENT_FALLBACKS = frozenset({"extract", "fail"})
+_PARSING_PROVIDERS = frozenset({"auto", "docling", "basic"})
+_REASONING_EFFORTS = frozenset({"minimal", "low", "medium", "high", "xhigh"})
+_TEXT_VERBOSITY = frozenset({"low", "medium", "high"})
+
 
 class ConfigurationService:
     """
@@ -500,7 +512,6 @@ class ConfigurationService:
                 add_error("llm", "Missing required key: 'model'")
             if not config.get("llm", {}).get("provider_api_keys"):
                 add_error("llm", "Missing required key: 'provider_api_keys'")
-            allowed_reasoning_efforts = {"minimal", "low", "medium", "high", "xhigh"}
             supported_llm_providers = {
                 "openai",
                 "gemini",
@@ -512,24 +523,22 @@ class ConfigurationService:
             }
             llm_defaults_mode = str(config.get("llm", {}).get("default_attachment_mode", "extracted_only")).strip().lower()
             llm_defaults_fallback = str(config.get("llm", {}).get("default_attachment_fallback", "extract")).strip().lower()
-            allowed_attachment_modes = {"extracted_only", "native_only", "native_plus_extracted"}
-            allowed_attachment_fallbacks = {"extract", "fail"}
-            if llm_defaults_mode not in allowed_attachment_modes:
+            if llm_defaults_mode not in _ATTACHMENT_MODES:
                 add_error(
                     "llm.default_attachment_mode",
-                    f"Unsupported value '{llm_defaults_mode}'. Must be one of: {sorted(allowed_attachment_modes)}."
+                    f"Unsupported value '{llm_defaults_mode}'. Must be one of: {sorted(_ATTACHMENT_MODES)}."
                 )
-            if llm_defaults_fallback not in allowed_attachment_fallbacks:
+            if llm_defaults_fallback not in _ATTACHMENT_FALLBACKS:
                 add_error(
                     "llm.default_attachment_fallback",
-                    f"Unsupported value '{llm_defaults_fallback}'. Must be one of: {sorted(allowed_attachment_fallbacks)}."
+                    f"Unsupported value '{llm_defaults_fallback}'. Must be one of: {sorted(_ATTACHMENT_FALLBACKS)}."
                 )
             if "reasoning_effort" in config.get("llm", {}):
                 llm_reasoning_effort = str(config.get("llm", {}).get("reasoning_effort") or "").strip().lower()
-                if llm_reasoning_effort not in allowed_reasoning_efforts:
+                if llm_reasoning_effort not in _REASONING_EFFORTS:
                     add_error(
                         "llm.reasoning_effort",
-                        f"Unsupported value '{llm_reasoning_effort}'. Must be one of: {sorted(allowed_reasoning_efforts)}."
+                        f"Unsupported value '{llm_reasoning_effort}'. Must be one of: {sorted(_REASONING_EFFORTS)}."
                     )
 
             llm_available_models = config.get("llm", {}).get("available_models") or []
@@ -777,20 +786,6 @@ class ConfigurationService:
         prompt_list, categories_config = self._get_prompt_config(config)
 
         category_set = set(categories_config)
-        allowed_agent_roles = {
-            "workspace_chat",
-            "workspace_agent",
-            "channels",
-            "operations",
-        }
-        allowed_queue_tiers = {"default", "low"}
-        allowed_output_schema_modes = {"best_effort", "strict"}
-        allowed_output_response_modes = {"chat_compatible", "structured_only"}
-        allowed_attachment_modes = {"extracted_only", "native_only", "native_plus_extracted"}
-        allowed_attachment_parser_providers = {"auto", "docling", "basic"}
-        allowed_attachment_fallbacks = {"extract", "fail"}
-        allowed_reasoning_efforts = {"minimal", "low", "medium", "high", "xhigh"}
-        allowed_text_verbosity = {"low", "medium", "high"}
         default_llm_model = str(config.get("llm", {}).get("model") or "").strip()
         allowed_llm_models = set()
         if default_llm_model:
@@ -822,18 +817,18 @@ class ConfigurationService:
                 continue
 
             agent_role = str(runtime_policy.get("role", "") or "").strip().lower()
-            if agent_role and agent_role not in allowed_agent_roles:
+            if agent_role and agent_role not in _AGENT_ROLES:
                 add_error(
                     f"prompts[{i}].runtime_policy.role",
-                    f"Unsupported runtime_policy.role '{agent_role}'. Must be one of: {sorted(allowed_agent_roles)}.",
+                    f"Unsupported runtime_policy.role '{agent_role}'. Must be one of: {sorted(_AGENT_ROLES)}.",
                 )
                 continue
 
             queue_tier = str(runtime_policy.get("queue_tier", "") or "").strip().lower()
-            if queue_tier and queue_tier not in allowed_queue_tiers:
+            if queue_tier and queue_tier not in _QUEUE_TIERS:
                 add_error(
                     f"prompts[{i}].runtime_policy.queue_tier",
-                    f"Unsupported runtime_policy.queue_tier '{queue_tier}'. Must be one of: {sorted(allowed_queue_tiers)}.",
+                    f"Unsupported runtime_policy.queue_tier '{queue_tier}'. Must be one of: {sorted(_QUEUE_TIERS)}.",
                 )
                 continue
 
@@ -841,38 +836,38 @@ class ConfigurationService:
                 add_error(f"prompts[{i}]", f"Category '{prompt_cat}' is not defined in 'prompt_categories'.")
 
             schema_mode = str(prompt.get("output_schema_mode", "best_effort")).strip().lower()
-            if schema_mode not in allowed_output_schema_modes:
+            if schema_mode not in _OUTPUT_SCHEMA_MODES:
                 add_error(
                     f"prompts[{i}]",
-                    f"Unsupported output_schema_mode '{schema_mode}'. Must be one of: {sorted(allowed_output_schema_modes)}."
+                    f"Unsupported output_schema_mode '{schema_mode}'. Must be one of: {sorted(_OUTPUT_SCHEMA_MODES)}."
                 )
 
             response_mode = str(prompt.get("output_response_mode", "chat_compatible")).strip().lower()
-            if response_mode not in allowed_output_response_modes:
+            if response_mode not in _OUTPUT_RESPONSE_MODES:
                 add_error(
                     f"prompts[{i}]",
-                    f"Unsupported output_response_mode '{response_mode}'. Must be one of: {sorted(allowed_output_response_modes)}."
+                    f"Unsupported output_response_mode '{response_mode}'. Must be one of: {sorted(_OUTPUT_RESPONSE_MODES)}."
                 )
 
             attachment_mode = str(prompt.get("attachment_mode", "extracted_only")).strip().lower()
-            if attachment_mode not in allowed_attachment_modes:
+            if attachment_mode not in _ATTACHMENT_MODES:
                 add_error(
                     f"prompts[{i}]",
-                    f"Unsupported attachment_mode '{attachment_mode}'. Must be one of: {sorted(allowed_attachment_modes)}."
+                    f"Unsupported attachment_mode '{attachment_mode}'. Must be one of: {sorted(_ATTACHMENT_MODES)}."
                 )
 
             attachment_fallback = str(prompt.get("attachment_fallback", "extract")).strip().lower()
-            if attachment_fallback not in allowed_attachment_fallbacks:
+            if attachment_fallback not in _ATTACHMENT_FALLBACKS:
                 add_error(
                     f"prompts[{i}]",
-                    f"Unsupported attachment_fallback '{attachment_fallback}'. Must be one of: {sorted(allowed_attachment_fallbacks)}."
+                    f"Unsupported attachment_fallback '{attachment_fallback}'. Must be one of: {sorted(_ATTACHMENT_FALLBACKS)}."
                 )
 
             attachment_parser_provider = str(prompt.get("attachment_parser_provider", "auto")).strip().lower()
-            if attachment_parser_provider not in allowed_attachment_parser_providers:
+            if attachment_parser_provider not in _PARSING_PROVIDERS:
                 add_error(
                     f"prompts[{i}]",
-                    f"Unsupported attachment_parser_provider '{attachment_parser_provider}'. Must be one of: {sorted(allowed_attachment_parser_providers)}."
+                    f"Unsupported attachment_parser_provider '{attachment_parser_provider}'. Must be one of: {sorted(_PARSING_PROVIDERS)}."
                 )
 
             prompt_llm_model = str(prompt.get("llm_model") or "").strip()
@@ -911,10 +906,10 @@ class ConfigurationService:
                         )
 
                     reasoning_effort = str(llm_request_options.get("reasoning_effort") or "").strip().lower()
-                    if reasoning_effort and reasoning_effort not in allowed_reasoning_efforts:
+                    if reasoning_effort and reasoning_effort not in _REASONING_EFFORTS:
                         add_error(
                             f"prompts[{i}].llm_request_options.reasoning_effort",
-                            f"Unsupported value '{reasoning_effort}'. Must be one of: {sorted(allowed_reasoning_efforts)}.",
+                            f"Unsupported value '{reasoning_effort}'. Must be one of: {sorted(_REASONING_EFFORTS)}.",
                         )
 
                     if "store" in llm_request_options and not isinstance(llm_request_options.get("store"), bool):
@@ -924,10 +919,10 @@ class ConfigurationService:
                         )
 
                     text_verbosity = str(llm_request_options.get("text_verbosity") or "").strip().lower()
-                    if text_verbosity and text_verbosity not in allowed_text_verbosity:
+                    if text_verbosity and text_verbosity not in _TEXT_VERBOSITY:
                         add_error(
                             f"prompts[{i}].llm_request_options.text_verbosity",
-                            f"Unsupported value '{text_verbosity}'. Must be one of: {sorted(allowed_text_verbosity)}.",
+                            f"Unsupported value '{text_verbosity}'. Must be one of: {sorted(_TEXT_VERBOSITY)}.",
                         )
 
                     if "prompt_version" in llm_request_options:
@@ -1015,13 +1010,12 @@ class ConfigurationService:
             add_error("knowledge_base", "Section must be a dictionary.")
         elif kb_config:
             parsing_provider = kb_config.get("parsing_provider")
-            allowed_parsing_providers = {"auto", "docling", "basic"}
             if parsing_provider is not None:
                 if not isinstance(parsing_provider, str):
                     add_error("knowledge_base.parsing_provider", "Must be a string.")
-                elif parsing_provider.strip().lower() not in allowed_parsing_providers:
+                elif parsing_provider.strip().lower() not in _PARSING_PROVIDERS:
                     add_error("knowledge_base.parsing_provider",
-                              f"Unsupported provider '{parsing_provider}'. Must be one of: {sorted(allowed_parsing_providers)}")
+                              f"Unsupported provider '{parsing_provider}'. Must be one of: {sorted(_PARSING_PROVIDERS)}")
 
             collections_config = kb_config.get("collections", [])
             if collections_config is not None:
@@ -1042,9 +1036,9 @@ class ConfigurationService:
                                 if not isinstance(parser_provider, str):
                                     add_error(f"knowledge_base.collections[{i}].parser_provider",
                                               "Must be a string if provided.")
-                                elif parser_provider.strip().lower() not in allowed_parsing_providers:
+                                elif parser_provider.strip().lower() not in _PARSING_PROVIDERS:
                                     add_error(f"knowledge_base.collections[{i}].parser_provider",
-                                              f"Unsupported provider '{parser_provider}'. Must be one of: {sorted(allowed_parsing_providers)}")
+                                              f"Unsupported provider '{parser_provider}'. Must be one of: {sorted(_PARSING_PROVIDERS)}")
                         else:
                             add_error(f"knowledge_base.collections[{i}]",
                                       "Each collection must be a string or an object with keys like {name, parser_provider}.")
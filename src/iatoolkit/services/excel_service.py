@@ -10,11 +10,20 @@ from iatoolkit.common.exceptions import IAToolkitException
 from iatoolkit.services.i18n_service import I18nService
 from iatoolkit.services.storage_service import StorageService
 from injector import inject
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+import datetime
 import io
 import json
+import numbers
+import numpy as np
 
 EXCEL_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
+# values openpyxl writes as typed cells; anything else (lists, dicts...) is written as text
+_EXCEL_CELL_TYPES = (str, numbers.Number, np.bool_, datetime.date, datetime.time, datetime.timedelta)
+
 
 class ExcelService:
     @inject
@@ -26,6 +35,34 @@ class ExcelService:
         self.i18n_service = i18n_service
         self.storage_service = storage_service
 
+    @staticmethod
+    def _render_xlsx(df: pd.DataFrame, sheet_name: str) -> bytes:
+        """
+        Writes the DataFrame as a single-sheet workbook.
+        The write-only workbook streams rows to the XML instead of keeping a cell object per value.
+        """
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=sheet_name)
+
+        header_font = Font(bold=True)
+        header = []
+        for column in df.columns:
+            cell = WriteOnlyCell(sheet, value=str(column))
+            cell.font = header_font
+            header.append(cell)
+        sheet.append(header)
+
+        # missing values become empty cells and non-scalar values text, as pandas' to_excel does
+        for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+            sheet.append([
+                value if value is None or isinstance(value, _EXCEL_CELL_TYPES) else str(value)
+                for value in row
+            ])
+
+        output = io.BytesIO()
+        workbook.save(output)
+        return output.getvalue()
+
     def read_excel(self, file_content: bytes) -> str:
         """
         Reads an Excel file and converts its content to a JSON string.
@@ -108,10 +145,7 @@ class ExcelService:
             storage_filename = f"{uuid4()}.xlsx"
 
             # 4. render the Excel file to bytes
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name=sheet_name)
-            excel_bytes = output.getvalue()
+            excel_bytes = self._render_xlsx(df, sheet_name)
 
             # 5. upload to storage
             storage_key = self.storage_service.upload_generated_download(
@@ -33,11 +33,13 @@ class JWTService:
                 logging.error(f"Missing token ID: {company_short_name}/{user_identifier}")
                 return None
 
+            # one clock read; integer NumericDate claims keep the signed payload short
+            now = int(time.time())
             payload = {
                 'company_short_name': company_short_name,
                 'user_identifier': user_identifier,
-                'exp': time.time() + expires_delta_seconds,
-                'iat': time.time(),
+                'exp': now + expires_delta_seconds,
+                'iat': now,
                 'type': 'chat_session'  # Identificador del tipo de token
             }
             token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
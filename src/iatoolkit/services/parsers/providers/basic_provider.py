@@ -37,6 +37,17 @@ class BasicParsingProvider:
         self.i18n_service = i18n_service
         self.max_doc_pages = int(os.getenv("MAX_DOC_PAGES", "200"))
 
+        # file_to_txt readers by lower-case extension: one lookup instead of an endswith chain
+        self._text_readers = {
+            '.docx': self._docx_to_txt,
+            '.txt': self._plain_text_to_txt,
+            '.md': self._plain_text_to_txt,
+            '.pdf': self._pdf_to_txt,
+            '.xlsx': self._excel_to_txt,
+            '.xls': self._excel_to_txt,
+            '.csv': self._csv_to_txt,
+        }
+
     def supports(self, request: ParseRequest) -> bool:
         return True
 
@@ -141,31 +152,14 @@ class BasicParsingProvider:
 
     def file_to_txt(self, filename, file_content, allow_ocr: bool = False, pdf_needs_ocr: bool | None = None):
         try:
-            if filename.lower().endswith('.docx'):
-                return self.read_docx(file_content)
-            if filename.lower().endswith('.txt') or filename.lower().endswith('.md'):
-                if isinstance(file_content, bytes):
-                    try:
-                        file_content = file_content.decode('utf-8')
-                    except UnicodeDecodeError:
-                        raise IAToolkitException(
-                            IAToolkitException.ErrorType.FILE_FORMAT_ERROR,
-                            self.i18n_service.t('errors.services.no_text_file'),
-                        )
-
-                return file_content
-            if filename.lower().endswith('.pdf'):
-                if self.is_scanned_pdf(file_content, precomputed=pdf_needs_ocr):
-                    return self.read_scanned_pdf(file_content) if allow_ocr else ""
-                return self.read_pdf(file_content)
-            if filename.lower().endswith(('.xlsx', '.xls')):
-                return self.excel_service.read_excel(file_content)
-            if filename.lower().endswith('.csv'):
-                return self.excel_service.read_csv(file_content)
-            raise IAToolkitException(
-                IAToolkitException.ErrorType.FILE_FORMAT_ERROR,
-                "Formato de archivo desconocido",
-            )
+            _, dot, extension = filename.lower().rpartition('.')
+            reader = self._text_readers.get(dot + extension)
+            if reader is None:
+                raise IAToolkitException(
+                    IAToolkitException.ErrorType.FILE_FORMAT_ERROR,
+                    "Formato de archivo desconocido",
+                )
+            return reader(file_content, allow_ocr, pdf_needs_ocr)
         except IAToolkitException:
             raise
         except Exception as e:
@@ -175,6 +169,31 @@ class BasicParsingProvider:
                 f"Error processing file: {e}",
             ) from e
 
+    def _docx_to_txt(self, file_content, allow_ocr: bool, pdf_needs_ocr: bool | None):
+        return self.read_docx(file_content)
+
+    def _plain_text_to_txt(self, file_content, allow_ocr: bool, pdf_needs_ocr: bool | None):
+        if isinstance(file_content, bytes):
+            try:
+                file_content = file_content.decode('utf-8')
+            except UnicodeDecodeError:
+                raise IAToolkitException(
+                    IAToolkitException.ErrorType.FILE_FORMAT_ERROR,
+                    self.i18n_service.t('errors.services.no_text_file'),
+                )
+        return file_content
+
+    def _pdf_to_txt(self, file_content, allow_ocr: bool, pdf_needs_ocr: bool | None):
+        if self.is_scanned_pdf(file_content, precomputed=pdf_needs_ocr):
+            return self.read_scanned_pdf(file_content) if allow_ocr else ""
+        return self.read_pdf(file_content)
+
+    def _excel_to_txt(self, file_content, allow_ocr: bool, pdf_needs_ocr: bool | None):
+        return self.excel_service.read_excel(file_content)
+
+    def _csv_to_txt(self, file_content, allow_ocr: bool, pdf_needs_ocr: bool | None):
+        return self.excel_service.read_csv(file_content)
+
     def read_docx(self, file_content):
         try:
             file_like_object = io.BytesIO(file_content)
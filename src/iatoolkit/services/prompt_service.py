@@ -427,11 +427,32 @@ class PromptService:
             "attachment_fallback": self._normalize_attachment_fallback(llm_config.get("default_attachment_fallback")),
         }
 
-    def _normalize_llm_model(self, company_short_name: str, llm_model: str | None) -> str | None:
+    def _normalize_llm_model(self,
+                             company_short_name: str,
+                             llm_model: str | None,
+                             allowed_models: set[str] | None = None) -> str | None:
         candidate = str(llm_model or "").strip()
         if not candidate:
             return None
 
+        if allowed_models is None:
+            allowed_models = self._get_allowed_llm_models(company_short_name)
+
+        if candidate in allowed_models:
+            return candidate
+
+        if not allowed_models:
+            raise IAToolkitException(
+                IAToolkitException.ErrorType.INVALID_PARAMETER,
+                "Cannot assign llm_model because the company has no configured models.",
+            )
+
+        raise IAToolkitException(
+            IAToolkitException.ErrorType.INVALID_PARAMETER,
+            f"Unsupported llm_model '{candidate}'. Allowed values: {sorted(allowed_models)}",
+        )
+
+    def _get_allowed_llm_models(self, company_short_name: str) -> set[str]:
         default_llm_model, available_llm_models = self.configuration_service.get_llm_configuration(company_short_name)
         allowed_models = set()
 
@@ -448,19 +469,7 @@ class PromptService:
                 if model_id:
                     allowed_models.add(model_id)
 
-        if candidate in allowed_models:
-            return candidate
-
-        if not allowed_models:
-            raise IAToolkitException(
-                IAToolkitException.ErrorType.INVALID_PARAMETER,
-                "Cannot assign llm_model because the company has no configured models.",
-            )
-
-        raise IAToolkitException(
-            IAToolkitException.ErrorType.INVALID_PARAMETER,
-            f"Unsupported llm_model '{candidate}'. Allowed values: {sorted(allowed_models)}",
-        )
+        return allowed_models
 
     def _extract_llm_request_options_payload(self, data: dict) -> dict:
         options_payload = data.get("llm_request_options")
@@ -625,9 +634,9 @@ class PromptService:
 
                 prompts_by_category[cat_key].append(prompt)
 
-            # sort each category by order
-            for cat_key in prompts_by_category:
-                prompts_by_category[cat_key].sort(key=lambda p: p.order)
+            # sort each category by order; prompts without an order go last
+            for prompts in prompts_by_category.values():
+                prompts.sort(key=lambda p: (p.order is None, p.order or 0))
 
             categorized_prompts = []
 
@@ -1018,23 +1027,27 @@ class PromptService:
             return
 
         try:
-            # 1. Sync Categories
-            category_map = {}
-
-            for i, category_name in enumerate(categories_config):
-                category_obj = PromptCategory(
-                    company_id=company.id,
-                    name=category_name,
-                    order=i + 1
-                )
-                # Persist and get back the object with ID
-                persisted_cat = self.llm_query_repo.create_or_update_prompt_category(category_obj)
-                category_map[category_name] = persisted_cat
+            # 1. Sync Categories (flushed so their ids are available, committed with the prompts)
+            persisted_categories = self.llm_query_repo.create_or_update_prompt_categories(
+                company.id,
+                [
+                    PromptCategory(company_id=company.id, name=category_name, order=i + 1)
+                    for i, category_name in enumerate(categories_config)
+                ],
+                commit=False,
+            )
+            category_map = dict(zip(categories_config, persisted_categories))
 
             # 2. Sync Prompts
             defined_prompt_names = set()
+            new_prompts = []
             company_default_policy = self._get_company_default_attachment_policy(company_short_name)
 
+            # the company's model list is the same for every prompt, resolve it once
+            allowed_llm_models = None
+            if any(str(prompt_data.get('llm_model') or '').strip() for prompt_data in prompt_list):
+                allowed_llm_models = self._get_allowed_llm_models(company_short_name)
+
             for prompt_data in prompt_list:
                 category_name = prompt_data.get('category')
                 if category_name and category_name not in category_map:
@@ -1086,15 +1099,18 @@ class PromptService:
                     attachment_fallback=self._normalize_attachment_fallback(
                         prompt_data.get("attachment_fallback", company_default_policy["attachment_fallback"])
                     ),
-                    llm_model=self._normalize_llm_model(company_short_name, prompt_data.get("llm_model")),
+                    llm_model=self._normalize_llm_model(
+                        company_short_name, prompt_data.get("llm_model"), allowed_llm_models
+                    ),
                     llm_request_options=self._normalize_llm_request_options(
                         self._extract_llm_request_options_payload(prompt_data)
                     ),
                     tool_policy=self._normalize_tool_policy(prompt_data.get("tool_policy")),
                     runtime_policy=runtime_policy,
                 )
+                new_prompts.append(new_prompt)
 
-                self.llm_query_repo.create_or_update_prompt(new_prompt)
+            self.llm_query_repo.create_or_update_prompts(company.id, new_prompts, commit=False)
 
             # 3. Cleanup: Delete prompts present in DB but not in Config
             existing_prompts = self.llm_query_repo.get_prompts(company, include_all=True)
@@ -1127,18 +1143,17 @@ class PromptService:
                                      f'Company {company_short_name} not found')
 
         try:
-            processed_categories_ids = []
-
             # 1. Update/Create Categories
-            for idx, cat_name in enumerate(categories_config):
-                # Order is 0-based index or 1-based, consistent with current usage (seems 0 or 1 is fine, usually 0 for arrays)
-                new_cat = PromptCategory(
-                    company_id=company.id,
-                    name=cat_name,
-                    order=idx
-                )
-                persisted_cat = self.llm_query_repo.create_or_update_prompt_category(new_cat)
-                processed_categories_ids.append(persisted_cat.id)
+            # Order is 0-based index or 1-based, consistent with current usage (seems 0 or 1 is fine, usually 0 for arrays)
+            persisted_categories = self.llm_query_repo.create_or_update_prompt_categories(
+                company.id,
+                [
+                    PromptCategory(company_id=company.id, name=cat_name, order=idx)
+                    for idx, cat_name in enumerate(categories_config)
+                ],
+                commit=False,
+            )
+            processed_categories_ids = [category.id for category in persisted_categories]
 
             # 2. Delete missing categories
             # We fetch all categories for the company and delete those not in processed_ids
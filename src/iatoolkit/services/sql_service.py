@@ -13,6 +13,8 @@ from typing import Callable
 import json
 import logging
 import re
+import threading
+import time
 
 
 @singleton
@@ -22,6 +24,9 @@ class SqlService:
     It maintains a cache of named DatabaseManager instances to avoid reconnecting.
     """
     MAX_QUERY_ROWS = 1000
+    # introspected structures are reused for this long, so DDL changes show up
+    # in every worker without a restart
+    DATABASE_STRUCTURE_TTL_SECONDS = 300
     _ALLOWED_QUERY_PREFIXES = ("SELECT", "WITH")
     _BLOCKED_SQL_PATTERN = re.compile(
         r"\b(?:INSERT|UPDATE|DELETE|DROP|ALTER|CREATE|TRUNCATE|MERGE|CALL|COPY|GRANT|REVOKE|"
@@ -50,6 +55,16 @@ class SqlService:
         # cache for database schemas. Key is tuple: (company_short_name, db_name)
         self._db_schemas: dict[tuple[str, str], str] = {}
 
+        # cache for introspected database structures. Key is tuple: (company_short_name, db_name)
+        # Value is tuple: (introspection time, structure)
+        self._db_structures: dict[tuple[str, str], tuple[float, dict]] = {}
+
+        # direct connections shared by every company/db pointing at the same target,
+        # so each engine and its connection pool is created once.
+        # Key is tuple: (db_uri, schema, timeout)
+        self._direct_managers: dict[tuple, DatabaseManager] = {}
+        self._direct_managers_lock = threading.Lock()
+
         # Registry of factory functions.
         # Format: {'connection_type': function(config_dict) -> DatabaseProvider}
         self._provider_factories: dict[str, Callable[[dict], DatabaseProvider]] = {}
@@ -71,7 +86,14 @@ class SqlService:
         if not uri:
             raise IAToolkitException(IAToolkitException.ErrorType.DATABASE_ERROR,
                                      "Missing db_uri for direct connection")
-        return DatabaseManager(uri, schema=schema, register_pgvector=False, timeout=timeout)
+
+        manager_key = (uri, schema, timeout)
+        with self._direct_managers_lock:
+            manager = self._direct_managers.get(manager_key)
+            if manager is None:
+                manager = DatabaseManager(uri, schema=schema, register_pgvector=False, timeout=timeout)
+                self._direct_managers[manager_key] = manager
+        return manager
 
     def register_database(self, company_short_name: str, db_name: str, config: dict):
         """
@@ -91,7 +113,11 @@ class SqlService:
         try:
             # Create the provider using the appropriate factory
             provider_instance = factory(config)
+            previous = self._db_connections.get(key)
             self._db_connections[key] = provider_instance
+            self._db_structures.pop(key, None)
+            if previous is not None and previous is not provider_instance:
+                self._release_provider(key, previous)
 
             # save the db_schema
             self._db_schemas[key] = config.get('schema', 'public')
@@ -104,13 +130,26 @@ class SqlService:
         for key in keys_to_clear:
             provider = self._db_connections.pop(key, None)
             self._db_schemas.pop(key, None)
-            # Release resources for providers backed by SQLAlchemy engines.
-            try:
-                engine = getattr(provider, "engine", None)
-                if engine and hasattr(engine, "dispose"):
-                    engine.dispose()
-            except Exception:
-                logging.debug("Failed to dispose SQL engine for key=%s", key)
+            self._db_structures.pop(key, None)
+            if provider is not None:
+                self._release_provider(key, provider)
+
+    def _release_provider(self, key: tuple[str, str], provider: DatabaseProvider):
+        # a shared direct connection stays open while another database still uses it
+        if any(other is provider for other in self._db_connections.values()):
+            return
+        with self._direct_managers_lock:
+            for manager_key, manager in list(self._direct_managers.items()):
+                if manager is provider:
+                    del self._direct_managers[manager_key]
+
+        # Release resources for providers backed by SQLAlchemy engines.
+        try:
+            engine = getattr(provider, "engine", None)
+            if engine and hasattr(engine, "dispose"):
+                engine.dispose()
+        except Exception:
+            logging.debug("Failed to dispose SQL engine for key=%s", key)
 
     def get_db_names(self, company_short_name: str) -> list[str]:
         """
@@ -334,10 +373,20 @@ class SqlService:
         """
         Introspects the specified database and returns its structure (Tables & Columns).
         Used for the Schema Editor 2.0
+        The introspection is cached per database for DATABASE_STRUCTURE_TTL_SECONDS;
+        callers get their own copy to enrich.
         """
+        key = (company_short_name, db_name)
+        now = time.monotonic()
+        cached = self._db_structures.get(key)
+        if cached is not None and now - cached[0] < self.DATABASE_STRUCTURE_TTL_SECONDS:
+            return self._copy_database_structure(cached[1])
+
         try:
             provider = self.get_database_provider(company_short_name, db_name)
-            return provider.get_database_structure()
+            structure = provider.get_database_structure()
+            self._db_structures[key] = (now, structure)
+            return self._copy_database_structure(structure)
         except IAToolkitException:
             raise
         except Exception as e:
@@ -346,3 +395,25 @@ class SqlService:
                 IAToolkitException.ErrorType.DATABASE_ERROR,
                 f"Failed to introspect database: {str(e)}"
             )
+
+    @staticmethod
+    def _copy_database_structure(structure: dict) -> dict:
+        # tables and columns are enriched in place by callers, nested values are only replaced
+        return {
+            table_name: {
+                **table_data,
+                'columns': [dict(column) for column in table_data.get('columns', [])],
+            }
+            for table_name, table_data in structure.items()
+        }
+
+    def clear_database_structure_cache(self, company_short_name: str, db_name: str | None = None):
+        """
+        Forgets the cached structure of one database, or of every database of the company.
+        """
+        keys_to_clear = [
+            key for key in self._db_structures
+            if key[0] == company_short_name and (db_name is None or key[1] == db_name)
+        ]
+        for key in keys_to_clear:
+            self._db_structures.pop(key, None)
@@ -10,7 +10,7 @@ import mimetypes
 import os
 import inspect
 from injector import inject
-from typing import Dict
+from typing import BinaryIO, Dict, Optional
 from flask import current_app, has_app_context
 from itsdangerous import URLSafeSerializer, BadSignature
 
@@ -119,16 +119,18 @@ class StorageService:
         if normalized_extension and not normalized_extension.startswith("."):
             normalized_extension = f".{normalized_extension}"
 
-        supports_prefix = False
         try:
-            supports_prefix = "prefix" in inspect.signature(connector.list_files).parameters
+            list_parameters = inspect.signature(connector.list_files).parameters
         except (TypeError, ValueError):
-            supports_prefix = False
+            list_parameters = {}
 
-        if supports_prefix:
-            files = connector.list_files(prefix=normalized_prefix or None)
-        else:
-            files = connector.list_files()
+        # let connectors that support it narrow the listing themselves
+        list_kwargs = {}
+        if "prefix" in list_parameters:
+            list_kwargs["prefix"] = normalized_prefix or None
+        if normalized_extension and "extension" in list_parameters:
+            list_kwargs["extension"] = normalized_extension
+        files = connector.list_files(**list_kwargs)
 
         normalized_files = []
         for item in files or []:
@@ -242,6 +244,17 @@ class StorageService:
         except Exception as e:
             raise IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR, str(e))
 
+    def open_document(self, company_short_name: str, storage_key: str) -> tuple[BinaryIO, Optional[int]]:
+        """
+        Opens a readable stream over the content, so callers don't hold the whole file in memory.
+        Returns the stream and the content size in bytes (None when the backend doesn't report it).
+        """
+        try:
+            connector = self._get_connector(company_short_name)
+            return connector.open_file(storage_key)
+        except Exception as e:
+            raise IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR, str(e))
+
 
     def delete_file(self, company_short_name: str, storage_key: str) -> None:
         """
@@ -95,6 +95,7 @@ class ToolService:
         self._web_search_service = web_search_service
         self._knowledge_wiki_service = knowledge_wiki_service
         self.system_tool_force_include_capabilities = get_system_tool_force_include_capabilities()
+        self.serialized_context_max_chars = int(os.getenv("TOOL_SERIALIZED_CONTEXT_MAX_CHARS", "12000"))
 
         # execution mapper for system tools
         self.system_handlers = {
@@ -163,7 +164,10 @@ class ToolService:
             "collection": collection,
             "count": len(typed_chunks),
             "chunks": typed_chunks,
-            "serialized_context": self._serialize_document_chunks(typed_chunks),
+            "serialized_context": self._serialize_document_chunks(
+                typed_chunks,
+                max_chars=self.serialized_context_max_chars,
+            ),
         }
 
     def _handle_image_search_tool(self,
@@ -348,11 +352,10 @@ class ToolService:
         )
 
     @staticmethod
-    def _serialize_document_chunks(chunks: list[dict]) -> str:
+    def _serialize_document_chunks(chunks: list[dict], max_chars: int = 12000) -> str:
         if not chunks:
             return "No chunks found."
 
-        max_chars = int(os.getenv("TOOL_SERIALIZED_CONTEXT_MAX_CHARS", "12000"))
         lines = []
 
         for index, item in enumerate(chunks, start=1):
@@ -1030,6 +1033,7 @@ class ToolService:
 
             # Set of tool names defined in the current YAML
             yaml_tool_names = set()
+            yaml_tools = []
 
             # 2. Sync (Create or Update) from Config
             for tool_data in tools_config:
@@ -1056,13 +1060,15 @@ class ToolService:
                     tool_type=Tool.TYPE_NATIVE,
                     source=Tool.SOURCE_YAML,
                 )
+                yaml_tools.append(tool_obj)
 
-                self.llm_query_repo.create_or_update_tool(tool_obj)
+            # upsert every tool in one pass, committed together with the cleanup below
+            self.llm_query_repo.create_or_update_company_tools(company.id, yaml_tools, commit=False)
 
             # 3. Cleanup: Delete tools that are managed by YAML but are no longer in the file
             for tool in all_tools:
                 if tool.source == Tool.SOURCE_YAML and tool.name not in yaml_tool_names:
-                    self.llm_query_repo.delete_tool(tool)
+                    self.llm_query_repo.delete_tool(tool, commit=False)
 
             self.llm_query_repo.commit()
 
@@ -1,3 +1,6 @@
+import io
+from unittest.mock import MagicMock, patch
+
 from flask import Flask
 
 from iatoolkit.common.routes import register_views
@@ -11,3 +14,68 @@ def test_register_views_does_not_publish_invocations_route():
 
     rules = {rule.rule for rule in app.url_map.iter_rules()}
     assert "/<company_short_name>/api/invocations" not in rules
+
+
+def test_version_route_returns_the_registered_version():
+    app = Flask(__name__)
+    app.config["VERSION"] = "test"
+
+    register_views(app)
+
+    response = app.test_client().get("/version")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"iatoolkit_version": "test"}
+
+
+class _NonSeekableStream(io.RawIOBase):
+    # stands in for a storage stream (e.g. an S3 StreamingBody) that send_file cannot size
+    def __init__(self, content: bytes):
+        self._buffer = io.BytesIO(content)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._buffer.readinto(b)
+
+
+def _download_client(content: bytes):
+    app = Flask(__name__)
+    app.config["VERSION"] = "test"
+    register_views(app)
+
+    storage_service = MagicMock()
+    storage_service.resolve_download_token.return_value = {
+        "company": "acme",
+        "storage_key": "companies/acme/generated_downloads/1/report.txt",
+        "filename": "report.txt",
+    }
+    storage_service.generate_presigned_url.return_value = None
+    storage_service.open_document.side_effect = lambda *args: (_NonSeekableStream(content), len(content))
+
+    toolkit = MagicMock()
+    toolkit.get_injector.return_value.get.return_value = storage_service
+    return app.test_client(), toolkit
+
+
+def test_download_fallback_streams_with_content_length():
+    client, toolkit = _download_client(b"0123456789")
+
+    with patch("iatoolkit.core.current_iatoolkit", return_value=toolkit):
+        response = client.get("/download/token")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Length"] == "10"
+    assert response.data == b"0123456789"
+
+
+def test_download_fallback_serves_byte_ranges():
+    client, toolkit = _download_client(b"0123456789")
+
+    with patch("iatoolkit.core.current_iatoolkit", return_value=toolkit):
+        response = client.get("/download/token", headers={"Range": "bytes=2-5"})
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == "bytes 2-5/10"
+    assert response.data == b"2345"
@@ -0,0 +1,29 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+import json
+
+import pytest
+
+from iatoolkit.common import json_utils
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_json_loads_matches_the_standard_library(monkeypatch, orjson_installed):
+    if not orjson_installed:
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+    documents = (
+        '{"a": "ñ", "n": [1, 2.5]}',
+        '{"x": NaN, "y": 1e400}',
+        '{"big": 123456789012345678901234567890, "low": -9223372036854775809}',
+        '"\\ud800"',
+    )
+    for document in documents:
+        parsed = json_utils.json_loads(document)
+        assert json.dumps(parsed) == json.dumps(json.loads(document))
+
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.json_loads("{not json")
@@ -12,3 +12,10 @@ class TestModelRegistry:
     def test_openai_models_keep_server_side_history(self):
         assert self.registry.get_provider("gpt-5.2") == "openai"
         assert self.registry.get_history_type("gpt-5.2") == "server_side"
+
+    def test_get_provider_keeps_first_matching_provider_order(self):
+        assert self.registry.get_provider("openrouter/anthropic/claude-3-haiku") == "anthropic"
+        assert self.registry.get_provider("openrouter/meta-llama/llama-3") == "openrouter"
+        assert self.registry.get_provider("DeepSeek-V4-Pro") == "deepseek"
+        assert self.registry.get_provider("llama-3") == "unknown"
+        assert self.registry.get_provider("") == "unknown"
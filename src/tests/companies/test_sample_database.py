@@ -0,0 +1,128 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+import io
+import sqlite3
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.elements import TextClause
+
+from companies.sample_company import sample_database
+from companies.sample_company.sample_database import SampleCompanyDatabase
+from iatoolkit.repositories.database_manager import DatabaseManager
+
+# the schema script and the workbook are referenced relative to the project root
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+XLSX_PATH = 'companies/sample_company/sample_data/northwind.xlsx'
+
+
+class TestSampleCompanyDatabase:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(PROJECT_ROOT)
+        self.db_path = tmp_path / 'sample.db'
+        self.db_manager = DatabaseManager(f'sqlite:///{self.db_path}', schema=None, register_pgvector=False)
+        yield
+        self.db_manager.get_connection().engine.dispose()
+
+    def test_create_and_populate_loads_every_sheet_on_sqlite(self):
+        results = SampleCompanyDatabase(self.db_manager).create_and_populate(XLSX_PATH)
+
+        workbook = pd.ExcelFile(XLSX_PATH)
+        order_details = workbook.parse('OrderDetails').drop_duplicates(subset=['OrderID', 'ProductID'])
+        with sqlite3.connect(self.db_path) as db:
+            for table_name, rows in results.items():
+                assert db.execute(f'SELECT COUNT(*) FROM {table_name}').fetchone()[0] == rows
+
+            assert results['order_details'] == len(order_details)
+            assert results['employees'] == len(workbook.parse('Employees'))
+            # missing cells load as NULL and date columns as ISO dates
+            assert db.execute('SELECT COUNT(*) FROM customers WHERE region IS NULL').fetchone()[0] == 40
+            assert db.execute('SELECT birthdate FROM employees WHERE employeeid = 1').fetchone()[0] == '1961-10-29'
+
+    def _connection_settings(self) -> tuple:
+        with self.db_manager.get_connection() as connection:
+            raw_connection = connection.connection.driver_connection
+            return raw_connection, [
+                connection.exec_driver_sql(f'PRAGMA {name}').scalar()
+                for name in ('synchronous', 'temp_store', 'cache_size')
+            ]
+
+    def test_create_and_populate_restores_sqlite_settings(self):
+        raw_connection, settings_before = self._connection_settings()
+
+        SampleCompanyDatabase(self.db_manager).create_and_populate(XLSX_PATH)
+
+        # same pooled connection, back to the settings it had
+        raw_connection_after, settings_after = self._connection_settings()
+        assert raw_connection_after is raw_connection
+        assert settings_after == settings_before
+
+        with sqlite3.connect(self.db_path) as db:
+            assert db.execute('PRAGMA journal_mode').fetchone()[0] == 'delete'
+        assert not Path(f'{self.db_path}-wal').exists()
+
+    @pytest.mark.parametrize('dialect_name, driver, method', [
+        ('postgresql', 'psycopg2', '_copy_from_csv'),
+        ('postgresql', 'psycopg', '_executemany_positional'),
+        ('postgresql', 'asyncpg', '_executemany_positional'),
+        ('mysql', 'pymysql', '_executemany_positional'),
+    ])
+    def test_insert_options_only_copy_over_psycopg2(self, dialect_name, driver, method):
+        options = SampleCompanyDatabase._insert_options(dialect_name, driver, 4)
+
+        assert options['method'] is getattr(sample_database, method)
+
+    def test_copy_from_csv_marks_nulls_apart_from_empty_strings(self):
+        cursor = MagicMock(rowcount=3)
+        connection = MagicMock()
+        connection.dialect.identifier_preparer.quote = lambda name: f'"{name}"'
+        connection.connection.driver_connection.cursor.return_value.__enter__.return_value = cursor
+        pd_table = MagicMock(schema='public')
+        pd_table.name = 'customers'
+        payloads = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: payloads.append(buffer.read())
+
+        rows = [(1, None, date(2024, 1, 31)), (2, '', None), (3, '\\N', 'a,"b"')]
+        count = sample_database._copy_from_csv(pd_table, connection, ['id', 'region', 'since'], iter(rows))
+
+        assert count == 3
+        sql = cursor.copy_expert.call_args.args[0]
+        assert sql == 'COPY "public"."customers" ("id", "region", "since") FROM STDIN WITH (FORMAT csv, NULL \'\\N\')'
+        assert payloads == ['1,\\N,2024-01-31\r\n2,"",\\N\r\n3,"\\N","a,""b"""\r\n']
+
+    def test_create_schema_runs_server_ddl_through_text(self):
+        db_manager = MagicMock(schema=None)
+        db_manager.get_dialect.return_value = 'mysql'
+        connection = MagicMock()
+        script = io.StringIO("CREATE TABLE t (pct VARCHAR(10) DEFAULT '50%');\nCREATE TABLE u (id INT);\n")
+
+        SampleCompanyDatabase(db_manager)._create_schema(connection, script)
+
+        # text() escapes '%' for pyformat drivers, a raw driver string would be formatted with it
+        clauses = [call.args[0] for call in connection.execute.call_args_list]
+        assert all(isinstance(clause, TextClause) for clause in clauses)
+        compiled = str(clauses[0].compile(dialect=postgresql.psycopg2.dialect()))
+        assert "DEFAULT '50%%'" in compiled
+        connection.exec_driver_sql.assert_not_called()
+
+    def test_read_sheet_dedupes_on_sheet_columns_outside_the_table(self):
+        workbook = MagicMock()
+        workbook.parse.return_value = pd.DataFrame({
+            'OrderID': [1, 1, 2],
+            'LineKey': ['a', 'a', 'b'],
+            'Quantity': [5, 7, 3],
+        })
+        plan = ('OrderDetails', 'order_details', [], ['orderid', 'linekey'])
+
+        df = SampleCompanyDatabase(self.db_manager)._read_sheet(workbook, plan, ['orderid', 'quantity'])
+
+        assert list(df.columns) == ['orderid', 'quantity']
+        assert df.to_dict('records') == [{'orderid': 1, 'quantity': 5}, {'orderid': 2, 'quantity': 3}]
@@ -17,7 +17,7 @@ def test_create_gdrive_connector_with_service_account_secret_ref():
         }
     )
 
-    with patch("iatoolkit.infra.connectors.file_connector_factory.GoogleDriveConnector") as connector_cls:
+    with patch("iatoolkit.infra.connectors.google_drive_connector.GoogleDriveConnector") as connector_cls:
         FileConnectorFactory.create(
             {
                 "type": "gdrive",
@@ -47,7 +47,7 @@ def test_create_gcs_connector_with_service_account_secret_ref():
         }
     )
 
-    with patch("iatoolkit.infra.connectors.file_connector_factory.GoogleCloudStorageConnector") as connector_cls:
+    with patch("iatoolkit.infra.connectors.google_cloud_storage_connector.GoogleCloudStorageConnector") as connector_cls:
         FileConnectorFactory.create(
             {
                 "type": "gcs",
@@ -90,6 +90,28 @@ class TestGoogleCloudStorageConnector(unittest.TestCase):
         mock_blob.download_as_bytes.assert_called_once()
         self.assertEqual(content, b"file content")
 
+    def test_open_file_loads_metadata_before_streaming(self):
+        mock_blob = MagicMock()
+        mock_blob.size = 12
+        self.mock_bucket.blob.return_value = mock_blob
+
+        stream, size = self.connector.open_file("path/doc.pdf")
+
+        mock_blob.reload.assert_called_once()
+        mock_blob.open.assert_called_once_with('rb')
+        self.assertIs(stream, mock_blob.open.return_value)
+        self.assertEqual(size, 12)
+
+    def test_open_file_fails_early_when_blob_is_missing(self):
+        mock_blob = MagicMock()
+        mock_blob.reload.side_effect = Exception("404 Not Found")
+        self.mock_bucket.blob.return_value = mock_blob
+
+        with self.assertRaises(Exception):
+            self.connector.open_file("path/missing.pdf")
+
+        mock_blob.open.assert_not_called()
+
     def test_upload_file_success(self):
         """Prueba la subida de archivos."""
         # Arrange
@@ -83,6 +83,21 @@ class TestLocalFileConnector:
         assert result == b"file content"
         mock_open_file.assert_called_once_with(mock_file_path, "rb")
 
+    def test_open_file_returns_stream_and_size(self, tmp_path):
+        file_path = tmp_path / "report.xlsx"
+        file_path.write_bytes(b"file content")
+
+        stream, size = self.file_connector.open_file(str(file_path))
+        with stream:
+            assert stream.read() == b"file content"
+        assert size == len(b"file content")
+
+    def test_open_file_error(self, tmp_path):
+        with pytest.raises(IAToolkitException) as excinfo:
+            self.file_connector.open_file(str(tmp_path / "missing.xlsx"))
+
+        assert excinfo.value.error_type == IAToolkitException.ErrorType.FILE_IO_ERROR
+
     @patch("os.path.exists", return_value=True)
     @patch("os.remove")
     def test_delete_file_success(self, mock_remove, mock_exists):
@@ -125,6 +125,23 @@ class TestS3Connector(unittest.TestCase):
             },
         )
 
+    def test_list_files_filters_extension_while_paginating(self):
+        self.mock_s3_client.list_objects_v2.return_value = {
+            "Contents": [
+                {"Key": "test-prefix/test-folder/manual.PDF", "Size": 10, "LastModified": None},
+                {"Key": "test-prefix/test-folder/photo.png", "Size": 20, "LastModified": None},
+                {"Key": "test-prefix/test-folder/specs.pdf", "Size": 30, "LastModified": None},
+            ],
+            "IsTruncated": False,
+        }
+
+        result = self.connector.list_files(extension=".pdf")
+
+        self.assertEqual(
+            [item["path"] for item in result],
+            ["test-prefix/test-folder/manual.PDF", "test-prefix/test-folder/specs.pdf"],
+        )
+
     def test_list_files_returns_empty_list_when_no_contents(self):
         """Verifica que retorna lista vacía si S3 no devuelve 'Contents'."""
         self.mock_s3_client.list_objects_v2.return_value = {
@@ -180,6 +197,16 @@ class TestS3Connector(unittest.TestCase):
         self.mock_s3_client.get_object.assert_called_with(Bucket=self.bucket, Key=path)
         self.assertEqual(content, b"file content bytes")
 
+    def test_open_file_returns_body_and_content_length(self):
+        mock_streaming_body = MagicMock()
+        self.mock_s3_client.get_object.return_value = {"Body": mock_streaming_body, "ContentLength": 18}
+
+        stream, size = self.connector.open_file("path/to/file.txt")
+
+        self.mock_s3_client.get_object.assert_called_with(Bucket=self.bucket, Key="path/to/file.txt")
+        self.assertIs(stream, mock_streaming_body)
+        self.assertEqual(size, 18)
+
     def test_upload_file_with_content_type(self):
         """Verifica subida de archivo pasando ContentType."""
         # Act
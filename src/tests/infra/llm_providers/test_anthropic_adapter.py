@@ -4,6 +4,7 @@
 # IAToolkit is open source software.
 
 import json
+from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
@@ -46,6 +47,25 @@ class TestAnthropicAdapter:
         assert result.usage.total_tokens == 15
         assert result.content_parts[0] == {"type": "text", "text": "Hola desde Claude"}
 
+    def test_pending_tool_calls_drop_the_oldest_beyond_the_limit(self):
+        self.adapter._MAX_PENDING_TOOL_CALLS = 2
+        blocks = []
+        for call_id in ("toolu_1", "toolu_2", "toolu_3"):
+            block = MagicMock()
+            block.type = "tool_use"
+            block.id = call_id
+            block.name = "iat_sql_query"
+            block.input = {"query": "select 1"}
+            blocks.append(block)
+        self.mock_client.messages.create.return_value = self._mock_response(blocks)
+
+        self.adapter.create_response(
+            model="claude-3-5-sonnet-latest",
+            input=[{"role": "user", "content": "Consulta SQL"}],
+        )
+
+        assert list(self.adapter._tool_calls_by_id) == ["toolu_2", "toolu_3"]
+
     def test_create_response_with_tool_call(self):
         tool_block = MagicMock()
         tool_block.type = "tool_use"
@@ -163,3 +183,13 @@ class TestAnthropicAdapter:
 
         assert excinfo.value.error_type == IAToolkitException.ErrorType.LLM_ERROR
         assert "Error calling Anthropic API" in str(excinfo.value)
+
+    def test_tool_payloads_keep_standard_json_formatting(self):
+        output = AnthropicAdapter._serialize_tool_output({"at": datetime(2024, 1, 2, 3, 4, 5), "ratio": float("nan")})
+        assert output == '{"at": "2024-01-02 03:04:05", "ratio": NaN}'
+
+        assert AnthropicAdapter._serialize_tool_arguments('{"x": NaN}') == '{"x": NaN}'
+        assert AnthropicAdapter._normalize_tool_input('{"big": 123456789012345678901234567890}') == {
+            "big": 123456789012345678901234567890
+        }
+
@@ -0,0 +1,153 @@
+import importlib
+import io
+import sys
+import types
+import wave
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import torch
+
+
+class ProcessorInputs(dict):
+    def to(self, _device):
+        return self
+
+
+@pytest.fixture
+def handler_module(monkeypatch):
+    transformers_module = types.SimpleNamespace(
+        CLIPProcessor=MagicMock(),
+        CLIPModel=MagicMock(),
+        AutoTokenizer=MagicMock(),
+        AutoModel=MagicMock(),
+        pipeline=MagicMock(),
+    )
+    diffusers_module = types.SimpleNamespace(
+        DiffusionPipeline=MagicMock(),
+        DPMSolverMultistepScheduler=MagicMock(),
+    )
+    monkeypatch.setitem(sys.modules, "transformers", transformers_module)
+    monkeypatch.setitem(sys.modules, "diffusers", diffusers_module)
+    monkeypatch.setitem(sys.modules, "diffusers.utils", types.SimpleNamespace(export_to_video=MagicMock()))
+    monkeypatch.delenv("IATOOLKIT_MAX_RESIDENT_MODELS", raising=False)
+    monkeypatch.delenv("IATOOLKIT_DISABLE_COMPILE", raising=False)
+
+    previous_module = sys.modules.pop("iatoolkit.infra.inference_handler", None)
+    module = importlib.import_module("iatoolkit.infra.inference_handler")
+    yield module, transformers_module
+
+    sys.modules.pop("iatoolkit.infra.inference_handler", None)
+    if previous_module is not None:
+        sys.modules["iatoolkit.infra.inference_handler"] = previous_module
+
+
+def _cpu_handler(module):
+    handler = module.EndpointHandler()
+    handler.device = "cpu"
+    return handler
+
+
+def test_load_model_keeps_a_single_model_resident_by_default(handler_module):
+    module, transformers = handler_module
+    handler = _cpu_handler(module)
+
+    handler._load_model("openai/clip-a")
+    handler._load_model("openai/clip-b")
+
+    assert list(handler._resident_models) == ["openai/clip-b"]
+    assert transformers.CLIPModel.from_pretrained.call_count == 2
+
+
+def test_load_model_reuses_resident_models_and_evicts_least_recently_used(handler_module, monkeypatch):
+    module, transformers = handler_module
+    monkeypatch.setenv("IATOOLKIT_MAX_RESIDENT_MODELS", "2")
+    handler = _cpu_handler(module)
+
+    handler._load_model("openai/clip-a")
+    model_a = handler.model_instance
+    handler._load_model("openai/clip-b")
+    handler._load_model("openai/clip-a")
+
+    # hit: no reload, and the instances of model a are back in place
+    assert transformers.CLIPModel.from_pretrained.call_count == 2
+    assert handler.current_model_id == "openai/clip-a"
+    assert handler.model_instance is model_a
+
+    handler._load_model("openai/clip-c")
+
+    assert list(handler._resident_models) == ["openai/clip-a", "openai/clip-c"]
+    assert transformers.CLIPModel.from_pretrained.call_count == 3
+
+
+@pytest.mark.parametrize("raw_value, expected", [("3", 3), ("0", 1), ("many", 1)])
+def test_max_resident_models_is_read_from_the_environment(handler_module, monkeypatch, raw_value, expected):
+    module, _ = handler_module
+    monkeypatch.setenv("IATOOLKIT_MAX_RESIDENT_MODELS", raw_value)
+
+    assert module.EndpointHandler().max_resident_models == expected
+
+
+def test_compile_only_on_gpu_unless_disabled(handler_module, monkeypatch):
+    module, _ = handler_module
+    compile_mock = MagicMock(return_value="compiled")
+    monkeypatch.setattr(module.torch, "compile", compile_mock)
+    handler = _cpu_handler(module)
+    forward = MagicMock()
+
+    assert handler._compile(forward) is forward
+
+    handler.device = "cuda"
+    assert handler._compile(forward) == "compiled"
+    compile_mock.assert_called_once_with(forward, dynamic=True)
+
+    monkeypatch.setenv("IATOOLKIT_DISABLE_COMPILE", "1")
+    assert handler._compile(forward) is forward
+
+
+@pytest.mark.parametrize("samples", [
+    np.array([0, 1000, -1000, 32767, -32768], dtype=np.int16),
+    np.array([[0, 1], [-2, 3], [400, -500]], dtype=np.int16),
+    np.array([0, 128, 255], dtype=np.uint8),
+])
+def test_build_wav_bytes_matches_the_wave_module(handler_module, samples):
+    module, _ = handler_module
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+
+    expected = io.BytesIO()
+    with wave.open(expected, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(samples.dtype.itemsize)
+        writer.setframerate(16000)
+        writer.writeframes(samples.astype(samples.dtype.newbyteorder("<")).tobytes())
+
+    assert bytes(module.EndpointHandler._build_wav_bytes(samples, 16000)) == expected.getvalue()
+
+
+def test_build_wav_bytes_rejects_unsupported_sample_types(handler_module):
+    module, _ = handler_module
+
+    with pytest.raises(ValueError):
+        module.EndpointHandler._build_wav_bytes(np.array([1, 2], dtype=np.uint16), 16000)
+
+
+def test_text_embedding_pooling_matches_expanded_mask_sum(handler_module):
+    module, _ = handler_module
+    handler = _cpu_handler(module)
+    torch.manual_seed(0)
+    token_embeddings = torch.randn(1, 5, 8)
+    attention_mask = torch.tensor([[1, 1, 1, 0, 0]])
+    handler.processor_instance = MagicMock(return_value=ProcessorInputs(
+        input_ids=torch.zeros((1, 5), dtype=torch.long),
+        attention_mask=attention_mask,
+    ))
+    handler.model_instance = MagicMock(return_value=(token_embeddings,))
+
+    result = handler._handle_text_embedding({"text": "hola"})
+
+    # the pooling the handler used before the einsum contraction
+    mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
+    pooled = torch.sum(token_embeddings * mask_expanded, 1) / torch.clamp(mask_expanded.sum(1), min=1e-9)
+    expected = torch.nn.functional.normalize(pooled, p=2, dim=1)[0]
+    assert torch.allclose(torch.tensor(result["embedding"]), expected, atol=1e-6)
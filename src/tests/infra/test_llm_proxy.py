@@ -38,7 +38,7 @@ class TestLLMProxy:
 
         # Parches para los adaptadores
         self.openai_adapter_patcher = patch("iatoolkit.infra.llm_proxy.OpenAIAdapter")
-        self.gemini_adapter_patcher = patch("iatoolkit.infra.llm_proxy.GeminiAdapter")
+        self.gemini_adapter_patcher = patch("iatoolkit.infra.llm_providers.gemini_adapter.GeminiAdapter")
         self.deepseek_adapter_patcher = patch("iatoolkit.infra.llm_proxy.DeepseekAdapter")
         self.openai_compatible_adapter_patcher = patch("iatoolkit.infra.llm_proxy.OpenAICompatibleChatAdapter")
         self.openrouter_adapter_patcher = patch("iatoolkit.infra.llm_proxy.OpenRouterAdapter")
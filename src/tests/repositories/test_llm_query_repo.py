@@ -385,6 +385,60 @@ class TestLLMQueryRepo:
         assert result.id == cat.id
         assert result.order == 99
 
+    def test_create_or_update_prompt_categories_flushes_ids_without_commit(self):
+        existing = PromptCategory(name="Existing", order=1, company_id=self.company.id)
+        self.session.add(existing)
+        self.session.commit()
+
+        result = self.repo.create_or_update_prompt_categories(
+            self.company.id,
+            [PromptCategory(name="Existing", order=5, company_id=self.company.id),
+             PromptCategory(name="Fresh", order=6, company_id=self.company.id)],
+            commit=False,
+        )
+
+        assert result[0].id == existing.id
+        assert result[0].order == 5
+        assert result[1].id is not None
+
+        self.session.rollback()
+        assert self.repo.get_category_by_name(self.company.id, "Fresh") is None
+
+    def test_create_or_update_prompts_upserts_in_one_pass(self):
+        existing = Prompt(name="kept", description="old", filename="kept.prompt",
+                          company_id=self.company.id, order=1)
+        self.session.add(existing)
+        self.session.commit()
+
+        result = self.repo.create_or_update_prompts(
+            self.company.id,
+            [Prompt(name="kept", description="new", filename="kept.prompt", company_id=self.company.id, order=2),
+             Prompt(name="added", description="d", filename="added.prompt", company_id=self.company.id, order=3)],
+        )
+
+        assert result[0].id == existing.id
+        assert result[0].description == "new"
+        assert result[1].output_schema_mode == "best_effort"
+        assert {p.name for p in self.repo.get_prompts(self.company, include_all=True)} == {"kept", "added"}
+
+    def test_create_or_update_company_tools_upserts_in_one_pass(self):
+        existing = Tool(name="kept", company_id=self.company.id, description="old",
+                        parameters={}, tool_type=Tool.TYPE_NATIVE, source=Tool.SOURCE_YAML)
+        self.session.add(existing)
+        self.session.commit()
+
+        result = self.repo.create_or_update_company_tools(
+            self.company.id,
+            [Tool(name="kept", company_id=self.company.id, description="new",
+                  parameters={}, tool_type=Tool.TYPE_NATIVE, source=Tool.SOURCE_YAML),
+             Tool(name="added", company_id=self.company.id, description="d",
+                  parameters={}, tool_type=Tool.TYPE_NATIVE, source=Tool.SOURCE_YAML)],
+        )
+
+        assert result[0].id == existing.id
+        assert result[0].description == "new"
+        assert result[1].id is not None
+
 
     def test_get_history_empty_result(self):
         """Test get_history when no queries exist for the user"""
@@ -10,9 +10,17 @@ from iatoolkit.repositories.profile_repo import ProfileRepo
 from datetime import datetime
 from unittest.mock import MagicMock
 from sqlalchemy.exc import OperationalError
+import pytest
 
 
 class TestProfileRepo:
+    @pytest.fixture(autouse=True)
+    def clear_company_ids(self):
+        # the short_name -> id map is class-level; keep tests independent
+        ProfileRepo._company_ids.clear()
+        yield
+        ProfileRepo._company_ids.clear()
+
     def setup_method(self):
         self.db_manager = DatabaseManager('sqlite:///:memory:')
         self.db_manager.create_all()
@@ -110,6 +118,45 @@ class TestProfileRepo:
         assert self.repo.get_company('opensoft') == self.company
         assert self.repo.get_company_by_short_name('open') == self.company
 
+    def test_get_company_by_short_name_reuses_resolved_id(self):
+        self.session.add(self.company)
+        self.session.commit()
+        assert self.repo.get_company_by_short_name('open') == self.company
+
+        self.session.query = MagicMock(side_effect=AssertionError('short_name query not expected'))
+        assert self.repo.get_company_by_short_name('open') == self.company
+
+    def test_get_company_by_short_name_ignores_stale_id(self):
+        ProfileRepo._company_ids['open'] = 999
+        self.session.add(self.company)
+        self.session.commit()
+
+        assert self.repo.get_company_by_short_name('open') == self.company
+        assert ProfileRepo._company_ids['open'] == self.company.id
+
+    def test_company_id_is_forgotten_when_company_is_renamed(self):
+        self.session.add(self.company)
+        self.session.commit()
+        assert self.repo.get_company_by_short_name('open') == self.company
+
+        self.company.short_name = 'renamed'
+        self.session.commit()
+
+        assert 'open' not in ProfileRepo._company_ids
+        assert self.repo.get_company_by_short_name('open') is None
+        assert self.repo.get_company_by_short_name('renamed') == self.company
+
+    def test_company_id_is_forgotten_when_company_is_deleted(self):
+        self.session.add(self.company)
+        self.session.commit()
+        assert self.repo.get_company_by_short_name('open') == self.company
+
+        self.session.delete(self.company)
+        self.session.commit()
+
+        assert 'open' not in ProfileRepo._company_ids
+        assert self.repo.get_company_by_short_name('open') is None
+
     def test_get_company_by_id_when_not_found(self):
         result = self.repo.get_company_by_id(999)
 
@@ -2,7 +2,7 @@
 # tests/services/test_company_context_service.py
 
 import pytest
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 from iatoolkit.services.company_context_service import CompanyContextService
 from iatoolkit.services.sql_source_service import SqlSourceService
 from iatoolkit.common.interfaces.asset_storage import AssetRepository, AssetType
@@ -99,7 +99,7 @@ class TestCompanyContextService:
         assert "- **`role`** (string)" in result_context
 
         # Check returned tables list
-        assert "users" in db_tables[0].get("table_name")
+        assert "users" in db_tables[0][1]
 
     def test_get_sql_enriched_context_no_config(self):
         """
@@ -134,7 +134,7 @@ class TestCompanyContextService:
 
         assert "#### Tabla: `customers`" in result_context
         assert "#### Tabla: `orders`" not in result_context
-        assert db_tables == [{'db_name': 'main_db', 'table_name': 'customers'}]
+        assert db_tables == [('main_db', 'customers')]
 
     def test_get_sql_enriched_context_handles_error(self):
         """
@@ -504,6 +504,29 @@ class TestCompanyContextService:
         # Verify SQL service was NOT called
         self.mock_sql_service.get_database_structure.assert_not_called()
 
+    def test_repeated_sql_context_failure_warns_once(self):
+        self.mock_sql_source_service.list_sources.side_effect = ConnectionError("database unreachable")
+
+        with patch.dict('iatoolkit.services.company_context_service._last_context_warnings', clear=True), \
+                patch('iatoolkit.services.company_context_service.logging') as mock_logging:
+            assert self.context_service.get_sql_context(self.COMPANY_NAME) == ""
+            assert self.context_service.get_sql_context(self.COMPANY_NAME) == ""
+
+        mock_logging.warning.assert_called_once()
+        assert "database unreachable" in mock_logging.warning.call_args[0][0]
+        mock_logging.debug.assert_called_once()
+
+    def test_yaml_context_skips_tables_already_in_sql_context(self):
+        self.mock_asset_repo.list_files.return_value = ['main_db-orders.yaml']
+
+        result = self.context_service._get_yaml_schema_context(
+            self.COMPANY_NAME,
+            [('main_db', 'public.orders')],
+        )
+
+        assert result == ""
+        self.mock_asset_repo.read_text.assert_not_called()
+
     def test_yaml_context_skips_tables_excluded_from_sql_source_scope(self):
         self.mock_asset_repo.list_files.return_value = ['main_db-orders.yaml']
 
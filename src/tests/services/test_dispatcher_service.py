@@ -308,6 +308,18 @@ class TestDispatcher:
 
         assert "Tool 'unknown_tool' not registered" in str(excinfo.value)
 
+    def test_dispatch_unknown_tool_type_raises(self):
+        """Test that a tool with an unsupported type is rejected."""
+        mock_tool_def = MagicMock(spec=Tool)
+        mock_tool_def.tool_type = "UNKNOWN"
+        self.mock_tool_service.get_tool_definition.return_value = mock_tool_def
+
+        with pytest.raises(IAToolkitException) as excinfo:
+            self.dispatcher.dispatch("sample", "odd_tool")
+
+        assert excinfo.value.error_type == IAToolkitException.ErrorType.EXTERNAL_SOURCE_ERROR
+        assert "Unknown tool type 'UNKNOWN'" in str(excinfo.value)
+
     def test_dispatch_http_tool_success(self):
         """HTTP tools should be delegated to HttpToolService."""
         mock_tool_def = MagicMock(spec=Tool)
@@ -44,6 +44,16 @@ class TestBasicParsingProvider:
         result = self.provider.file_to_txt("test.xlsx", "dummy_content")
         assert result == 'json_content'
 
+    def test_file_to_txt_matches_extension_case_insensitively(self):
+        self.mock_excel_service.read_csv.return_value = 'csv_content'
+        assert self.provider.file_to_txt("REPORT.CSV", "dummy_content") == 'csv_content'
+        assert self.provider.file_to_txt("notes.v2.MD", b"# notes") == "# notes"
+
+    def test_file_to_txt_when_unknown_extension(self):
+        with pytest.raises(IAToolkitException) as excinfo:
+            self.provider.file_to_txt("archive.zip", b"dummy_content")
+        assert "FILE_FORMAT_ERROR" == excinfo.value.error_type.name
+
     @patch("iatoolkit.services.parsers.providers.basic_provider.BasicParsingProvider.is_scanned_pdf")
     @patch("iatoolkit.services.parsers.providers.basic_provider.BasicParsingProvider.read_scanned_pdf", return_value="Scanned text")
     @patch("iatoolkit.services.parsers.providers.basic_provider.BasicParsingProvider.read_pdf", return_value="PDF text")
@@ -173,3 +173,43 @@ class TestExcelService:
             storage_key="companies/acme/generated_downloads/1/generated.xlsx",
             filename="report.xlsx"
         )
+
+    def test_excel_generator_writes_rows_with_empty_cells_for_missing_keys(self):
+        self.mock_storage_service.upload_generated_download.return_value = "key"
+        self.mock_storage_service.create_download_token.return_value = "token"
+
+        with self.app.app_context():
+            self.app.config["SECRET_KEY"] = "test-secret"
+            self.excel_service.excel_generator(
+                "acme",
+                filename="report.xlsx",
+                data=[{"id": 1, "name": "Alice"}, {"id": 2}],
+                sheet_name="Sheet1"
+            )
+
+        excel_bytes = self.mock_storage_service.upload_generated_download.call_args.kwargs["file_content"]
+        df = pd.read_excel(io.BytesIO(excel_bytes), sheet_name="Sheet1")
+        assert list(df.columns) == ["id", "name"]
+        assert df["id"].tolist() == [1, 2]
+        assert df["name"].iloc[0] == "Alice"
+        assert pd.isna(df["name"].iloc[1])
+
+    def test_excel_generator_writes_nested_values_as_text(self):
+        self.mock_storage_service.upload_generated_download.return_value = "key"
+        self.mock_storage_service.create_download_token.return_value = "token"
+
+        with self.app.app_context():
+            self.app.config["SECRET_KEY"] = "test-secret"
+            result = self.excel_service.excel_generator(
+                "acme",
+                filename="report.xlsx",
+                data=[{"a": [1, 2], "b": {"x": 1}, "c": 3}],
+                sheet_name="Sheet1"
+            )
+
+        assert "error" not in result
+        excel_bytes = self.mock_storage_service.upload_generated_download.call_args.kwargs["file_content"]
+        df = pd.read_excel(io.BytesIO(excel_bytes), sheet_name="Sheet1")
+        assert df["a"].iloc[0] == "[1, 2]"
+        assert df["b"].iloc[0] == "{'x': 1}"
+        assert df["c"].iloc[0] == 3
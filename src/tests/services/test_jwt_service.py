@@ -70,6 +70,16 @@ class TestJWTService:
         # Usar pytest.approx para comparar timestamps con una tolerancia
         assert payload['exp'] == pytest.approx(time.time() + EXPIRES_DELTA_SECONDS, abs=5)
 
+    def test_generate_chat_jwt_uses_integer_claims_from_one_clock_read(self, jwt_service, app):
+        token = jwt_service.generate_chat_jwt(COMPANY_SHORT_NAME, EXTERNAL_USER_ID, EXPIRES_DELTA_SECONDS)
+        payload = jwt.decode(
+            token,
+            app.config['IATOOLKIT_SECRET_KEY'],
+            algorithms=[app.config['JWT_ALGORITHM']]
+        )
+        assert isinstance(payload['iat'], int)
+        assert payload['exp'] - payload['iat'] == EXPIRES_DELTA_SECONDS
+
     @patch('jwt.encode')
     def test_generate_chat_jwt_encode_exception(self, mock_jwt_encode, jwt_service):
         mock_jwt_encode.side_effect = Exception("JWT Encode Error")
@@ -140,6 +140,52 @@ class TestPromptService:
 
         assert prompt_names == ['active_prompt', 'inactive_prompt']
 
+    def test_get_prompts_orders_prompts_within_each_category(self):
+        self.profile_repo.get_company_by_short_name.return_value = self.mock_company
+        category = MagicMock(spec=PromptCategory)
+        category.name = 'Sales'
+        category.order = 2
+        late = self._build_prompt_mock(1, 'late', True)
+        late.order = 9
+        early = self._build_prompt_mock(2, 'early', True)
+        early.order = 1
+        categorized = self._build_prompt_mock(3, 'categorized', True)
+        categorized.category = category
+        self.llm_query_repo.get_prompts.return_value = [late, categorized, early]
+
+        result = self.prompt_service.get_prompts(company_short_name='test_company', include_all=True)
+
+        assert [c['category_name'] for c in result['message']] == [
+            self.prompt_service.DEFAULT_CATEGORY_LABEL, 'Sales'
+        ]
+        assert [p['prompt'] for p in result['message'][0]['prompts']] == ['early', 'late']
+        assert [p['prompt'] for p in result['message'][1]['prompts']] == ['categorized']
+
+    def test_get_prompts_puts_prompts_without_order_last_in_each_category(self):
+        self.profile_repo.get_company_by_short_name.return_value = self.mock_company
+        category = MagicMock(spec=PromptCategory)
+        category.name = 'Sales'
+        category.order = 2
+        unordered = self._build_prompt_mock(1, 'unordered', True)
+        unordered.order = None
+        ordered = self._build_prompt_mock(2, 'ordered', True)
+        ordered.order = 5
+        sales_unordered = self._build_prompt_mock(3, 'sales_unordered', True)
+        sales_unordered.order = None
+        sales_unordered.category = category
+        sales_ordered = self._build_prompt_mock(4, 'sales_ordered', True)
+        sales_ordered.order = 1
+        sales_ordered.category = category
+        self.llm_query_repo.get_prompts.return_value = [sales_unordered, unordered, sales_ordered, ordered]
+
+        result = self.prompt_service.get_prompts(company_short_name='test_company', include_all=True)
+
+        assert [c['category_name'] for c in result['message']] == [
+            self.prompt_service.DEFAULT_CATEGORY_LABEL, 'Sales'
+        ]
+        assert [p['prompt'] for p in result['message'][0]['prompts']] == ['ordered', 'unordered']
+        assert [p['prompt'] for p in result['message'][1]['prompts']] == ['sales_ordered', 'sales_unordered']
+
     # --- Tests para get_system_prompt ---
 
     @patch('iatoolkit.services.prompt_service.build_system_prompt_payload')
@@ -865,7 +911,7 @@ properties:
         # Mock category persistence
         mock_cat = MagicMock()
         mock_cat.id = 100
-        self.llm_query_repo.create_or_update_prompt_category.return_value = mock_cat
+        self.llm_query_repo.create_or_update_prompt_categories.return_value = [mock_cat]
 
         # Mock existing prompts for cleanup
         self.llm_query_repo.get_prompts.return_value = []
@@ -874,9 +920,33 @@ properties:
         self.prompt_service.sync_company_prompts('test_co', prompt_list, categories_config)
 
         # Se crean categorías
-        self.llm_query_repo.create_or_update_prompt_category.assert_called()
-        # Se crean prompts
-        self.llm_query_repo.create_or_update_prompt.assert_called()
+        self.llm_query_repo.create_or_update_prompt_categories.assert_called_once()
+        # Se crean prompts, en un solo lote y con un único commit al final
+        self.llm_query_repo.create_or_update_prompts.assert_called_once()
+        prompts_call = self.llm_query_repo.create_or_update_prompts.call_args
+        assert prompts_call.kwargs['commit'] is False
+        assert [p.name for p in prompts_call.args[1]] == ['p1']
+        assert prompts_call.args[1][0].category_id == 100
+        self.llm_query_repo.commit.assert_called_once()
+
+    @patch('iatoolkit.services.prompt_service.current_iatoolkit')
+    def test_sync_company_prompts_resolves_llm_models_once(self, mock_current_toolkit):
+        mock_current_toolkit.return_value.is_community = True
+        self.profile_repo.get_company_by_short_name.return_value = self.mock_company
+        self.llm_query_repo.get_prompts.return_value = []
+        prompt_list = [
+            {'name': 'p1', 'llm_model': 'gpt-4o-mini'},
+            {'name': 'p2', 'llm_model': 'gpt-4.1-mini'},
+            {'name': 'p3'},
+        ]
+
+        self.prompt_service.sync_company_prompts('test_co', prompt_list, [])
+
+        self.mock_configuration_service.get_llm_configuration.assert_called_once_with('test_co')
+        saved_models = [
+            prompt.llm_model for prompt in self.llm_query_repo.create_or_update_prompts.call_args.args[1]
+        ]
+        assert saved_models == ['gpt-4o-mini', 'gpt-4.1-mini', None]
 
     # --- Tests para sync_prompt_categories ---
 
@@ -895,21 +965,22 @@ properties:
         cat_old_mock = MagicMock(spec=PromptCategory, id=99, name='Cat Old')
         self.llm_query_repo.get_all_categories.return_value = [cat_a_mock, cat_old_mock]
 
-        # Simular que create_or_update devuelve un objeto con ID para simular persistencia
-        def side_effect_create_cat(cat_obj):
-            cat_obj.id = 1 if cat_obj.name == 'Cat A' else 2 # ID 1 existe, ID 2 nuevo
-            return cat_obj
-        self.llm_query_repo.create_or_update_prompt_category.side_effect = side_effect_create_cat
+        # Simular que create_or_update devuelve objetos con ID para simular persistencia
+        def side_effect_create_cats(company_id, cat_objs, commit=True):
+            for cat_obj in cat_objs:
+                cat_obj.id = 1 if cat_obj.name == 'Cat A' else 2 # ID 1 existe, ID 2 nuevo
+            return cat_objs
+        self.llm_query_repo.create_or_update_prompt_categories.side_effect = side_effect_create_cats
 
         # Act
         self.prompt_service.sync_prompt_categories('test_co', categories_config)
 
         # Assert
-        # 1. Verificar llamadas de creación/actualización (deben ser 2: Cat A y Cat B)
-        assert self.llm_query_repo.create_or_update_prompt_category.call_count == 2
-        calls = self.llm_query_repo.create_or_update_prompt_category.call_args_list
-        assert calls[0][0][0].name == 'Cat A'
-        assert calls[1][0][0].name == 'Cat B'
+        # 1. Verificar la llamada de creación/actualización (un solo lote: Cat A y Cat B)
+        self.llm_query_repo.create_or_update_prompt_categories.assert_called_once()
+        call = self.llm_query_repo.create_or_update_prompt_categories.call_args
+        assert [c.name for c in call.args[1]] == ['Cat A', 'Cat B']
+        assert call.kwargs['commit'] is False
 
         # 2. Verificar eliminación (debe borrar Cat Old porque su ID (99) no estaba en los procesados)
         # IDs procesados: 1 (Cat A) y 2 (Cat B). ID existente: 99.
@@ -921,7 +992,7 @@ properties:
     def test_sync_prompt_categories_db_error(self):
         """Prueba manejo de excepciones y rollback en sync_prompt_categories."""
         self.profile_repo.get_company_by_short_name.return_value = self.mock_company
-        self.llm_query_repo.create_or_update_prompt_category.side_effect = Exception("DB Error")
+        self.llm_query_repo.create_or_update_prompt_categories.side_effect = Exception("DB Error")
 
         with pytest.raises(IAToolkitException) as exc:
             self.prompt_service.sync_prompt_categories('test_co', ['C1'])
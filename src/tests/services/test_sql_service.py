@@ -112,7 +112,7 @@ class TestSqlService:
         self.service.register_database(COMPANY_SHORT_NAME, DB_NAME_SUCCESS, config)  # Second call
 
         # Assert
-        assert MockDatabaseManager.call_count == 2
+        MockDatabaseManager.assert_called_once()
 
     # --- Tests for Provider Retrieval ---
 
@@ -191,6 +191,105 @@ class TestSqlService:
         assert ('company_A', 'db_sales') not in self.service._db_connections
         assert ('company_B', 'db_sales') in self.service._db_connections
 
+    @patch('iatoolkit.services.sql_service.DatabaseManager')
+    def test_register_database_shares_direct_manager_for_same_uri(self, MockDatabaseManager):
+        MockDatabaseManager.side_effect = lambda *args, **kwargs: MagicMock()
+        config = {'DATABASE_URI': DUMMY_URI}
+        self.service.register_database('company_A', 'db_sales', config)
+        self.service.register_database('company_B', 'db_sales', config)
+        self.service.register_database('company_B', 'db_hr', {**config, 'schema': 'hr'})
+
+        assert MockDatabaseManager.call_count == 2
+        assert self.service._db_connections[('company_A', 'db_sales')] is \
+            self.service._db_connections[('company_B', 'db_sales')]
+        assert self.service._db_connections[('company_B', 'db_hr')] is not \
+            self.service._db_connections[('company_B', 'db_sales')]
+
+    @patch('iatoolkit.services.sql_service.DatabaseManager')
+    def test_clear_company_connections_keeps_shared_engine_open(self, MockDatabaseManager):
+        config = {'DATABASE_URI': DUMMY_URI}
+        self.service.register_database('company_A', 'db_sales', config)
+        self.service.register_database('company_B', 'db_sales', config)
+        shared_manager = MockDatabaseManager.return_value
+
+        self.service.clear_company_connections('company_A')
+        shared_manager.engine.dispose.assert_not_called()
+
+        self.service.clear_company_connections('company_B')
+        shared_manager.engine.dispose.assert_called_once()
+
+        # the next registration opens a fresh manager
+        self.service.register_database('company_A', 'db_sales', config)
+        assert MockDatabaseManager.call_count == 2
+
+    @patch('iatoolkit.services.sql_service.DatabaseManager')
+    def test_register_database_disposes_replaced_manager(self, MockDatabaseManager):
+        MockDatabaseManager.side_effect = lambda *args, **kwargs: MagicMock()
+        config = {'DATABASE_URI': DUMMY_URI}
+        self.service.register_database('company_A', 'db_sales', config)
+        old_manager = self.service._db_connections[('company_A', 'db_sales')]
+
+        self.service.register_database('company_A', 'db_sales', {**config, 'schema': 'sales'})
+
+        old_manager.engine.dispose.assert_called_once()
+        assert old_manager not in self.service._direct_managers.values()
+        assert self.service._db_connections[('company_A', 'db_sales')] is not old_manager
+
+    @patch('iatoolkit.services.sql_service.DatabaseManager')
+    def test_register_database_keeps_replaced_manager_still_in_use(self, MockDatabaseManager):
+        MockDatabaseManager.side_effect = lambda *args, **kwargs: MagicMock()
+        config = {'DATABASE_URI': DUMMY_URI}
+        self.service.register_database('company_A', 'db_sales', config)
+        self.service.register_database('company_B', 'db_sales', config)
+        shared_manager = self.service._db_connections[('company_A', 'db_sales')]
+
+        self.service.register_database('company_A', 'db_sales', {**config, 'schema': 'sales'})
+
+        shared_manager.engine.dispose.assert_not_called()
+        assert shared_manager in self.service._direct_managers.values()
+
+    def test_get_database_structure_introspects_once_and_returns_copies(self):
+        mock_provider = MagicMock(spec=DatabaseProvider)
+        mock_provider.get_database_structure.return_value = {
+            'users': {'object_type': 'table', 'columns': [{'name': 'id', 'type': 'INTEGER'}]}
+        }
+        self.service._db_connections[(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)] = mock_provider
+
+        first = self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        first['users']['description'] = 'enriched'
+        first['users']['columns'][0]['description'] = 'enriched'
+        second = self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+
+        mock_provider.get_database_structure.assert_called_once()
+        assert second == {'users': {'object_type': 'table', 'columns': [{'name': 'id', 'type': 'INTEGER'}]}}
+
+        self.service.clear_database_structure_cache(COMPANY_SHORT_NAME)
+        self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+
+        assert mock_provider.get_database_structure.call_count == 2
+
+    @patch('iatoolkit.services.sql_service.time.monotonic')
+    def test_get_database_structure_introspects_again_after_ttl(self, mock_monotonic):
+        mock_provider = MagicMock(spec=DatabaseProvider)
+        mock_provider.get_database_structure.side_effect = [
+            {'users': {'object_type': 'table', 'columns': [{'name': 'id', 'type': 'INTEGER'}]}},
+            {'users': {'object_type': 'table', 'columns': [{'name': 'id', 'type': 'INTEGER'},
+                                                           {'name': 'email', 'type': 'TEXT'}]}},
+        ]
+        self.service._db_connections[(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)] = mock_provider
+        ttl = SqlService.DATABASE_STRUCTURE_TTL_SECONDS
+
+        mock_monotonic.return_value = 1000.0
+        self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        mock_monotonic.return_value = 1000.0 + ttl - 1
+        cached = self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        mock_monotonic.return_value = 1000.0 + ttl
+        refreshed = self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+
+        assert len(cached['users']['columns']) == 1
+        assert [c['name'] for c in refreshed['users']['columns']] == ['id', 'email']
+        assert mock_provider.get_database_structure.call_count == 2
+
     # --- Tests for exec_sql (Delegation Logic) ---
 
     @patch('iatoolkit.services.sql_service.DatabaseManager')
@@ -22,6 +22,16 @@ class PrefixAwareConnector:
         return list(self.files)
 
 
+class ExtensionAwareConnector(PrefixAwareConnector):
+    def __init__(self, files):
+        super().__init__(files)
+        self.extension_calls = []
+
+    def list_files(self, prefix=None, extension=None):
+        self.extension_calls.append(extension)
+        return super().list_files(prefix=prefix)
+
+
 # ... existing code ...
 class TestStorageService(unittest.TestCase):
 
@@ -150,6 +160,18 @@ class TestStorageService(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["path"], "companies/acme/knowledge_wikis/sales/pricing.md")
 
+    def test_list_files_passes_extension_to_extension_aware_connector(self):
+        connector = ExtensionAwareConnector([
+            {"path": "companies/acme/knowledge_wikis/sales/pricing.md", "name": "pricing.md", "metadata": {}},
+        ])
+        self.mock_factory.create.return_value = connector
+
+        result = self.service.list_files(self.company_name, prefix="companies/acme", extension="MD")
+
+        self.assertEqual(connector.extension_calls, [".md"])
+        self.assertEqual(connector.prefix_calls, ["companies/acme"])
+        self.assertEqual(len(result), 1)
+
     def test_upload_document(self):
         # Arrange
         content = b"pdf content"
@@ -182,3 +204,25 @@ class TestStorageService(unittest.TestCase):
         args = self.mock_connector_instance.upload_file.call_args.kwargs
         self.assertEqual(args['content'], content)
         self.assertEqual(args['content_type'], mime)
+
+    def test_open_document_returns_connector_stream_and_size(self):
+        stream = MagicMock()
+        self.mock_connector_instance.open_file.return_value = (stream, 2048)
+
+        result_stream, result_size = self.service.open_document(
+            self.company_name, "companies/test_co/generated_downloads/1/report.xlsx"
+        )
+
+        self.assertIs(result_stream, stream)
+        self.assertEqual(result_size, 2048)
+        self.mock_connector_instance.open_file.assert_called_once_with(
+            "companies/test_co/generated_downloads/1/report.xlsx"
+        )
+
+    def test_open_document_wraps_connector_errors(self):
+        self.mock_connector_instance.open_file.side_effect = FileNotFoundError("missing")
+
+        with self.assertRaises(IAToolkitException) as ctx:
+            self.service.open_document(self.company_name, "missing.xlsx")
+
+        self.assertEqual(ctx.exception.error_type, IAToolkitException.ErrorType.FILE_IO_ERROR)
@@ -597,25 +597,29 @@ class TestToolService:
 
         # Assert
 
-        # 1. Upsert Calls
-        assert self.mock_llm_query_repo.create_or_update_tool.call_count == 2
-        calls = self.mock_llm_query_repo.create_or_update_tool.call_args_list
+        # 1. Upsert Calls, batched into one repository call without an intermediate commit
+        self.mock_llm_query_repo.create_or_update_tool.assert_not_called()
+        self.mock_llm_query_repo.create_or_update_company_tools.assert_called_once()
+        upsert_call = self.mock_llm_query_repo.create_or_update_company_tools.call_args
+        assert upsert_call.kwargs['commit'] is False
+        upserted_tools = upsert_call.args[1]
+        assert len(upserted_tools) == 2
 
         # Check 'yaml_keep' update
-        tool_keep = calls[0][0][0]
+        tool_keep = upserted_tools[0]
         assert tool_keep.name == 'yaml_keep'
         assert tool_keep.source == Tool.SOURCE_YAML
         assert tool_keep.tool_type == Tool.TYPE_NATIVE
 
         # Check 'new_yaml' creation
-        tool_new = calls[1][0][0]
+        tool_new = upserted_tools[1]
         assert tool_new.name == 'new_yaml'
         assert tool_new.source == Tool.SOURCE_YAML
         assert tool_new.tool_type == Tool.TYPE_NATIVE
 
         # 2. Delete Calls
         # Should only delete 'yaml_remove' because source=YAML and not in config
-        self.mock_llm_query_repo.delete_tool.assert_called_once_with(tool_yaml_remove)
+        self.mock_llm_query_repo.delete_tool.assert_called_once_with(tool_yaml_remove, commit=False)
 
         # 'user_defined' should NOT be deleted even though it's not in config
         # Verified implicitly by delete_tool called once.
@@ -1129,6 +1133,21 @@ class TestToolService:
         assert '"score": 0.8' in result["serialized_context"]
         assert "table_json=" in result["serialized_context"]
 
+    def test_system_document_search_truncates_serialized_context_to_configured_limit(self):
+        self.service.serialized_context_max_chars = 50
+        self.knowledge_base_service.search.return_value = [{
+            "id": 1,
+            "filename": "invoice.pdf",
+            "text": "x" * 200,
+            "chunk_meta": {},
+        }]
+
+        handler = self.service.get_system_handler("iat_document_search")
+        result = handler(company_short_name=self.company_short_name, query="total amount")
+
+        assert result["serialized_context"].endswith("\n...[truncated]")
+        assert len(result["serialized_context"]) == 50 + len("\n...[truncated]")
+
     def test_system_document_search_passes_none_collection_without_filter(self):
         self.knowledge_base_service.search.return_value = []
 
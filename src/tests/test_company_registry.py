@@ -0,0 +1,59 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from iatoolkit.base_company import BaseCompany
+from iatoolkit.company_registry import CompanyRegistry
+
+
+class LazyCompany(BaseCompany):
+    def register_cli_commands(self, app):
+        pass
+
+
+class TestCompanyRegistry:
+
+    def setup_method(self):
+        self.registry = CompanyRegistry()
+        self.module = types.ModuleType('lazy_company_module')
+        self.module.LazyCompany = LazyCompany
+        sys.modules['lazy_company_module'] = self.module
+
+    def teardown_method(self):
+        sys.modules.pop('lazy_company_module', None)
+
+    def test_register_class_path_defers_import_until_instantiation(self):
+        self.registry.register('Lazy', 'lazy_company_module:LazyCompany')
+        assert self.registry.get_registered_companies() == {'lazy': 'lazy_company_module:LazyCompany'}
+
+        injector = MagicMock()
+        instance = MagicMock(spec=LazyCompany)
+        injector.get.return_value = instance
+
+        instances = self.registry.instantiate_companies(injector)
+
+        injector.get.assert_called_once_with(LazyCompany)
+        assert instances == {'lazy': instance}
+        assert self.registry.get_registered_companies() == {'lazy': LazyCompany}
+
+    def test_register_rejects_malformed_class_path(self):
+        with pytest.raises(ValueError):
+            self.registry.register('lazy', 'lazy_company_module.LazyCompany')
+
+    def test_instantiate_rejects_class_path_not_subclassing_base_company(self):
+        self.module.NotACompany = object
+        self.registry.register('lazy', 'lazy_company_module:NotACompany')
+
+        with pytest.raises(ValueError):
+            self.registry.instantiate_companies(MagicMock())
+
+    def test_register_enforces_single_tenant_for_class_paths(self):
+        self.registry.register('lazy', 'lazy_company_module:LazyCompany')
+
+        with pytest.raises(RuntimeError):
+            self.registry.register('other', LazyCompany)
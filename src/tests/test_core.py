@@ -135,6 +135,14 @@ class TestIAToolkit(unittest.TestCase):
         with patch.dict(os.environ, {'TEST_KEY': 'env_value_override'}):
             self.assertEqual(toolkit._get_config_value('TEST_KEY'), 'config_value')
 
+    def test_get_config_value_skips_environment_lookup_on_config_hit(self):
+        toolkit = IAToolkit({'TEST_KEY': 'config_value'})
+
+        with patch('iatoolkit.core.os.getenv') as mock_getenv:
+            self.assertEqual(toolkit._get_config_value('TEST_KEY'), 'config_value')
+
+        mock_getenv.assert_not_called()
+
     def test_run_configured_startup_warmup_delegates_to_warmup_service(self):
         toolkit = IAToolkit({})
         warmup_service = MagicMock()
@@ -208,11 +216,25 @@ class TestIAToolkit(unittest.TestCase):
         mock_registry.get_all_company_instances.return_value = {'test_co': mock_company_instance}
         mock_get_registry.return_value = mock_registry
 
-        toolkit._setup_cli_commands()
+        with patch.dict(os.environ, {'FLASK_RUN_FROM_CLI': 'true'}):
+            toolkit._setup_cli_commands()
 
         mock_register_core.assert_called_once_with(toolkit.app)
         mock_company_instance.register_cli_commands.assert_called_once_with(toolkit.app)
 
+    @patch('iatoolkit.cli_commands.register_core_commands')
+    @patch('iatoolkit.company_registry.get_company_registry')
+    def test_setup_cli_commands_skipped_outside_flask_cli(self, mock_get_registry, mock_register_core):
+        toolkit = IAToolkit({})
+        toolkit.app = MagicMock()
+
+        with patch.dict(os.environ, clear=False) as env:
+            env.pop('FLASK_RUN_FROM_CLI', None)
+            toolkit._setup_cli_commands()
+
+        mock_register_core.assert_not_called()
+        mock_get_registry.assert_not_called()
+
     def test_current_iatoolkit_helper(self):
         """Test current_iatoolkit helper function returns the singleton."""
         tk = current_iatoolkit()